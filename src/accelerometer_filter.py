@@ -1,8 +1,75 @@
 # accelerometer_filter.py
 # Handles accelerometer calibration and tap detection with filtering
 # Uses Exponential Moving Average (EMA) filter to reduce noise
+# In "fifo" mode the MPU-6050 buffers samples at a fixed rate and each
+# detect_tap() drains them in one burst, so taps between frames aren't missed
+# In "motion" mode the sensor's own motion detector latches an interrupt and
+# detect_tap() is one status read (or just a pin check if INT is wired)
 
 import time
+import struct
+
+try:
+    import microcontroller
+except ImportError:
+    microcontroller = None  # No NVM (calibrate every boot)
+
+# Tap detection modes
+TAP_POLLED = "polled"  # Read acceleration once per detect_tap() (original)
+TAP_FIFO = "fifo"      # Burst-read the sensor's FIFO, filter every sample
+TAP_MOTION = "motion"  # Sensor's motion interrupt does the detecting
+
+# MPU-6050 registers (see the register map)
+_REG_CONFIG = 0x1A        # DLPF setting decides the internal sample clock
+_REG_ACCEL_CONFIG = 0x1C  # Range (bits 3-4) and high pass filter (bits 0-2)
+_REG_MOT_THR = 0x1F       # Motion threshold, 2 mg per count
+_REG_MOT_DUR = 0x20       # Motion duration, 1 ms per count
+_REG_FIFO_EN = 0x23       # Which data goes into the FIFO
+_REG_INT_PIN_CFG = 0x37   # INT pin behavior
+_REG_INT_ENABLE = 0x38    # Which events raise INT
+_REG_INT_STATUS = 0x3A    # Which events happened (reading it clears the latch)
+_REG_USER_CTRL = 0x6A     # FIFO enable / reset
+_REG_FIFO_COUNT = 0x72    # Bytes waiting in the FIFO (big-endian, 2 bytes)
+_REG_FIFO_R_W = 0x74      # Reading here pops bytes off the FIFO
+
+_FIFO_EN_ACCEL = 0x08     # Accelerometer X, Y, Z (6 bytes per sample)
+_USER_CTRL_FIFO_EN = 0x40
+_USER_CTRL_FIFO_RESET = 0x04
+_SAMPLE_BYTES = 6
+_ACCEL_HPF_5HZ = 0x01     # High pass so gravity doesn't count as motion
+_INT_LATCH = 0x20         # INT stays high until INT_STATUS is read
+_INT_MOTION = 0x40        # Motion detection bit (INT_ENABLE and INT_STATUS)
+_STANDARD_GRAVITY = 9.80665
+
+FIFO_SAMPLE_RATE = 100    # Samples per second in FIFO mode
+FIFO_MAX_SAMPLES = 32     # Burst buffer size (more waiting = stale, flush)
+TAP_COOLDOWN_S = 0.2      # Ignore new taps this long after one (10 frames at 50 FPS)
+MOTION_DURATION_MS = 1    # How long the threshold must be exceeded in motion mode
+
+# Saved calibration in microcontroller.nvm:
+# magic, version, baseline x/y/z (floats), 16-bit checksum of everything before it
+CALIBRATION_NVM_OFFSET = 0
+_CAL_MAGIC = b"TP"
+_CAL_VERSION = 1
+_CAL_FORMAT = "<2sB3f"
+_CAL_SIZE = struct.calcsize(_CAL_FORMAT)
+
+VALIDATION_SAMPLES = 8     # Quick readings used to check a loaded calibration
+DRIFT_TOLERANCE = 0.5      # m/s^2 per axis before a full recalibration
+CALIBRATION_INTERVAL = 0.05  # Seconds between normal calibration readings
+
+# What calibration_step() is working on
+_STEP_IDLE = 0
+_STEP_CALIBRATE = 1  # Averaging readings into a new baseline
+_STEP_VALIDATE = 2   # Comparing readings with a loaded baseline
+
+def _checksum(data):
+    """Simple 16-bit Fletcher checksum"""
+    a = b = 0
+    for byte in data:
+        a = (a + byte) % 255
+        b = (b + a) % 255
+    return (b << 8) | a
 
 class AccelerometerTapDetector:
     """
@@ -10,8 +77,18 @@ class AccelerometerTapDetector:
     Uses EMA filter to smooth out readings and reduce false positives
     """
     
-    def __init__(self, accelerometer):
+    def __init__(self, accelerometer, mode=TAP_POLLED, sample_rate=FIFO_SAMPLE_RATE,
+                 int_pin=None):
+        """
+        accelerometer: adafruit_mpu6050.MPU6050
+        mode: TAP_POLLED, TAP_FIFO or TAP_MOTION
+        sample_rate: FIFO sample rate in Hz (FIFO mode only)
+        int_pin: DigitalInOut wired to the MPU-6050 INT pin, or None
+                 (motion mode only, reads the status register instead)
+        """
         self.accelerometer = accelerometer
+        self.mode = mode
+        self.int_pin = int_pin
         
         # Calibration values (set during calibration)
         self.baseline_x = 0
@@ -28,31 +105,223 @@ class AccelerometerTapDetector:
         
         # EMA filter parameter (lower = more smoothing, less responsive)
         self.FILTER_ALPHA = 0.3
+        
+        # Cooldown is counted in samples: frames when polled, FIFO samples otherwise
+        self.cooldown_samples = 10
+        
+        # Preallocated buffers for raw register access
+        self._reg_buffer = bytearray(2)
+        self._fifo_buffer = bytearray(FIFO_MAX_SAMPLES * _SAMPLE_BYTES)
+        self._fifo_view = memoryview(self._fifo_buffer)
+        self.fifo_overflows = 0  # Times the FIFO had to be flushed
+        
+        # Step-by-step calibration/validation (can run between animation frames)
+        self._step_job = _STEP_IDLE
+        self._step_fast = False
+        self._step_left = 0
+        self._step_count = 0
+        self._step_sum = [0.0, 0.0, 0.0]
+        
+        if mode == TAP_FIFO:
+            self._start_fifo(sample_rate)
+        elif mode == TAP_MOTION:
+            self._start_motion()
     
-    def calibrate(self, num_samples=30):
+    def _write_register(self, register, value):
+        """Write one MPU-6050 register directly"""
+        buffer = self._reg_buffer
+        buffer[0], buffer[1] = register, value
+        device = self.accelerometer.i2c_device
+        with device:
+            device.write(buffer)
+    
+    def _read_registers(self, register, buffer):
+        """Read len(buffer) bytes starting at register (one I2C transaction)"""
+        self._reg_buffer[0] = register
+        device = self.accelerometer.i2c_device
+        with device:
+            device.write_then_readinto(self._reg_buffer, buffer, out_end=1)
+    
+    def _base_rate(self):
+        """Internal sample clock: 8 kHz with the low pass filter off, 1 kHz with it on"""
+        self._read_registers(_REG_CONFIG, self._fifo_view[0:1])
+        dlpf = self._fifo_buffer[0] & 0x07
+        return 8000 if dlpf in (0, 7) else 1000
+    
+    def _start_fifo(self, sample_rate):
+        """Set a fixed sample rate and start buffering accelerometer samples"""
+        base_rate = self._base_rate()
+        divisor = min(255, max(0, base_rate // sample_rate - 1))
+        self.accelerometer.sample_rate_divisor = divisor
+        self.sample_rate = base_rate / (divisor + 1)
+        
+        # Raw counts per g for the current range (+-2g = 16384 ... +-16g = 2048)
+        self._fifo_scale = _STANDARD_GRAVITY / (16384 >> self.accelerometer.accelerometer_range)
+        self.cooldown_samples = max(1, int(self.sample_rate * TAP_COOLDOWN_S))
+        
+        self._write_register(_REG_FIFO_EN, _FIFO_EN_ACCEL)
+        self.flush_fifo()
+        print(f"Accelerometer FIFO: {self.sample_rate:.0f} Hz")
+    
+    def _start_motion(self):
+        """Program the motion detector to latch an interrupt on a tap"""
+        # Same strength as the filtered check: TAP_THRESHOLD m/s^2 in 2 mg steps
+        threshold = int(self.TAP_THRESHOLD / _STANDARD_GRAVITY * 500)
+        self._write_register(_REG_MOT_THR, min(255, max(1, threshold)))
+        self._write_register(_REG_MOT_DUR, MOTION_DURATION_MS)
+        
+        # Keep the range bits, turn on the high pass filter
+        config = self._fifo_view[0:1]
+        self._read_registers(_REG_ACCEL_CONFIG, config)
+        self._write_register(_REG_ACCEL_CONFIG, (config[0] & 0xF8) | _ACCEL_HPF_5HZ)
+        
+        self._write_register(_REG_INT_PIN_CFG, _INT_LATCH)
+        self._write_register(_REG_INT_ENABLE, _INT_MOTION)
+        self.clear_motion()
+        print(f"Accelerometer motion interrupt: threshold {threshold * 2} mg")
+    
+    def clear_motion(self):
+        """Read INT_STATUS to drop the latch; returns True if motion was flagged"""
+        status = self._fifo_view[0:1]
+        self._read_registers(_REG_INT_STATUS, status)
+        return bool(status[0] & _INT_MOTION)
+    
+    def flush_fifo(self):
+        """Throw away buffered samples (stale data, or the FIFO overflowed)"""
+        self._write_register(_REG_USER_CTRL, _USER_CTRL_FIFO_RESET)
+        self._write_register(_REG_USER_CTRL, _USER_CTRL_FIFO_EN)
+    
+    def calibrate(self, num_samples=30, fast=False):
         """
         Calibrate by taking average of readings while device is still
-        Call this at startup before the game begins
+        Call this at startup before the game begins (blocks until done)
+        fast: read at the sensor's own output rate instead of every 50ms
+              (takes milliseconds instead of 1.5 seconds)
+        """
+        self.start_calibration(num_samples, fast)
+        self.finish_calibration()
+    
+    def _sample_delay(self, fast):
+        """Seconds between calibration readings"""
+        if fast:
+            # One sensor sample period, so every reading is a new sample
+            return (self.accelerometer.sample_rate_divisor + 1) / self._base_rate()
+        return CALIBRATION_INTERVAL
+    
+    def _start_steps(self, job, num_samples, fast):
+        """Reset the reading accumulator for a new job"""
+        self._step_job = job
+        self._step_fast = fast
+        self._step_left = self._step_count = num_samples
+        total = self._step_sum
+        total[0] = total[1] = total[2] = 0.0
+    
+    def start_calibration(self, num_samples=30, fast=False):
+        """
+        Start calibrating one reading at a time
+        Call calibration_step() every CALIBRATION_INTERVAL (e.g. once per
+        animation frame), or finish_calibration() to do the rest right away
         """
         print("Calibrating accelerometer...")
-        samples = []
+        self._start_steps(_STEP_CALIBRATE, num_samples, fast)
+    
+    def start_validation(self, num_samples=VALIDATION_SAMPLES, fast=False):
+        """
+        Check a loaded calibration a few readings at a time
+        fast: use fast calibration if it turns out a recalibration is needed
+        """
+        self._start_steps(_STEP_VALIDATE, num_samples, fast)
+    
+    @property
+    def calibrating(self):
+        """True while a calibration or validation still needs readings"""
+        return self._step_job != _STEP_IDLE
+    
+    def calibration_step(self):
+        """
+        Take one calibration/validation reading
+        After the last one, set the baseline (calibration), or compare with it
+        and recalibrate only if it has drifted (validation)
+        Returns True while more readings are needed
+        """
+        if self._step_job == _STEP_IDLE:
+            return False
+        x, y, z = self.accelerometer.acceleration
+        total = self._step_sum
+        total[0] += x
+        total[1] += y
+        total[2] += z
+        self._step_left -= 1
+        if self._step_left > 0:
+            return True
         
-        # Collect samples
-        for i in range(num_samples):
-            x, y, z = self.accelerometer.acceleration
-            samples.append((x, y, z))
-            time.sleep(0.05)
+        job = self._step_job
+        self._step_job = _STEP_IDLE
+        count = self._step_count
+        avg_x, avg_y, avg_z = total[0] / count, total[1] / count, total[2] / count
         
-        # Calculate baseline (average of all samples)
-        self.baseline_x = sum(s[0] for s in samples) / len(samples)
-        self.baseline_y = sum(s[1] for s in samples) / len(samples)
-        self.baseline_z = sum(s[2] for s in samples) / len(samples)
+        if job == _STEP_CALIBRATE:
+            # Calculate baseline (average of all samples)
+            self.baseline_x, self.baseline_y, self.baseline_z = avg_x, avg_y, avg_z
+            
+            # Initialize filter with baseline
+            self.filtered_x = self.baseline_x
+            self.prev_x = self.baseline_x
+            
+            print(f"Calibration complete: baseline=({self.baseline_x:.2f}, {self.baseline_y:.2f}, {self.baseline_z:.2f})")
+            self.save_calibration()
+            return False
         
-        # Initialize filter with baseline
-        self.filtered_x = self.baseline_x
-        self.prev_x = self.baseline_x
+        drift = max(abs(avg_x - self.baseline_x), abs(avg_y - self.baseline_y),
+                    abs(avg_z - self.baseline_z))
+        if drift > DRIFT_TOLERANCE:
+            print(f"Calibration drifted by {drift:.2f}, recalibrating")
+            self.start_calibration(fast=self._step_fast)
+            return True
+        return False
+    
+    def finish_calibration(self):
+        """Take all remaining readings now (blocking)"""
+        while self.calibration_step():
+            # Validation readings don't need to be spaced out
+            if self._step_job == _STEP_CALIBRATE:
+                time.sleep(self._sample_delay(self._step_fast))
+    
+    def save_calibration(self):
+        """Store the baseline in NVM so the next boot can skip calibration"""
+        if microcontroller is None or microcontroller.nvm is None:
+            return False
+        data = struct.pack(_CAL_FORMAT, _CAL_MAGIC, _CAL_VERSION,
+                           self.baseline_x, self.baseline_y, self.baseline_z)
+        record = data + struct.pack("<H", _checksum(data))
         
-        print(f"Calibration complete: baseline=({self.baseline_x:.2f}, {self.baseline_y:.2f}, {self.baseline_z:.2f})")
+        # Skip the write if NVM already holds exactly this
+        end = CALIBRATION_NVM_OFFSET + len(record)
+        if microcontroller.nvm[CALIBRATION_NVM_OFFSET:end] != record:
+            microcontroller.nvm[CALIBRATION_NVM_OFFSET:end] = record
+            print("Calibration saved")
+        return True
+    
+    def load_calibration(self):
+        """
+        Use the baseline saved in NVM (instant, no sampling)
+        Returns False if there is none, or it's from another version or corrupt
+        """
+        if microcontroller is None or microcontroller.nvm is None:
+            return False
+        record = microcontroller.nvm[CALIBRATION_NVM_OFFSET:
+                                     CALIBRATION_NVM_OFFSET + _CAL_SIZE + 2]
+        data = record[:_CAL_SIZE]
+        if struct.unpack("<H", record[_CAL_SIZE:])[0] != _checksum(data):
+            return False
+        magic, version, x, y, z = struct.unpack(_CAL_FORMAT, data)
+        if magic != _CAL_MAGIC or version != _CAL_VERSION:
+            return False
+        
+        self.baseline_x, self.baseline_y, self.baseline_z = x, y, z
+        self.filtered_x = self.prev_x = x
+        print(f"Calibration loaded: baseline=({x:.2f}, {y:.2f}, {z:.2f})")
+        return True
     
     def detect_tap(self):
         """
@@ -60,9 +329,50 @@ class AccelerometerTapDetector:
         Returns True if tap detected, False otherwise
         Call this every game loop iteration
         """
+        if self.mode == TAP_FIFO:
+            return self._detect_tap_fifo()
+        if self.mode == TAP_MOTION:
+            # INT wired: no bus traffic at all until it goes high
+            if self.int_pin is not None and not self.int_pin.value:
+                return False
+            return self.clear_motion()
+        
         # Read raw accelerometer value
         x, y, z = self.accelerometer.acceleration
+        return self._filter_sample(x)
+    
+    def _detect_tap_fifo(self):
+        """Run the filter over every sample buffered since the last call"""
+        count_buffer = self._fifo_view[0:2]
+        self._read_registers(_REG_FIFO_COUNT, count_buffer)
+        count = (self._fifo_buffer[0] << 8) | self._fifo_buffer[1]
+        
+        # Too much waiting (or overflowed) means it's old, start fresh
+        if count > len(self._fifo_buffer):
+            self.fifo_overflows += 1
+            self.flush_fifo()
+            return False
+        
+        samples = count // _SAMPLE_BYTES
+        if not samples:
+            return False
         
+        # One burst read for all of them
+        self._read_registers(_REG_FIFO_R_W, self._fifo_view[0:samples * _SAMPLE_BYTES])
+        
+        tap_detected = False
+        scale = self._fifo_scale
+        for i in range(samples):
+            raw_x = struct.unpack_from(">h", self._fifo_buffer, i * _SAMPLE_BYTES)[0]
+            if self._filter_sample(raw_x * scale):
+                tap_detected = True
+        return tap_detected
+    
+    def _filter_sample(self, x):
+        """
+        Feed one x reading through the EMA filter and tap check
+        Returns True if it completes a tap
+        """
         # Apply Exponential Moving Average filter to smooth noise
         # Formula: filtered = alpha * new_value + (1-alpha) * old_filtered
         self.filtered_x = self.FILTER_ALPHA * x + (1 - self.FILTER_ALPHA) * self.filtered_x
@@ -79,7 +389,7 @@ class AccelerometerTapDetector:
         if self.tap_cooldown == 0:
             if dev_x > self.TAP_THRESHOLD and delta_x > 1.5:
                 tap_detected = True
-                self.tap_cooldown = 10  # Prevent re-detecting same tap
+                self.tap_cooldown = self.cooldown_samples  # Prevent re-detecting same tap
         
         # Decrease cooldown counter
         if self.tap_cooldown > 0:
@@ -91,4 +401,8 @@ class AccelerometerTapDetector:
         """Reset filter state when starting a new level"""
         self.filtered_x = self.baseline_x
         self.prev_x = self.baseline_x
-        self.tap_cooldown = 0
\ No newline at end of file
+        self.tap_cooldown = 0
+        if self.mode == TAP_FIFO:
+            self.flush_fifo()  # Samples from before the level-up don't count
+        elif self.mode == TAP_MOTION:
+            self.clear_motion()  # Neither does motion latched before it
\ No newline at end of file
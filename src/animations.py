@@ -1,18 +1,40 @@
 # animations.py
 # Startup animations and splash screens
 # Includes Windows logo and cockpit HUD animation
+# The HUD can be streamed from pre-rendered frames (hud_frames.py)
+# Both can run an idle() callback every frame (calibration readings during
+# boot) which can also end them early (button pressed to skip)
 
 import displayio
 import terminalio
 from adafruit_display_text import label
 import time
-import math
-from graphics import draw_spaceship, draw_stars
+from graphics import draw_spaceship, draw_stars, draw_radar_frame
+from blit import fill_rect
+from hud_frames import HEADER_SIZE, frame_bytes, read_header
+from sounds import SoundSequencer, SFX_WINDOWS
 
-def show_windows_splash(display, buzzer, play_windows_sound_func):
+try:
+    import bitmaptools
+except ImportError:
+    bitmaptools = None  # HUD animation is drawn live
+
+FRAME_TIME = 0.05  # Seconds per animation frame
+FRAME_NS = 50000000  # Same in nanoseconds (HUD frame clock)
+TICK_TIME = 0.01   # Sound sequencer step while the splash chime plays
+
+# "SCANNING" with 0-3 dots
+_SCANNING = ("SCANNING", "SCANNING.", "SCANNING..", "SCANNING...")
+
+def show_windows_splash(display, buzzer, play_windows_sound_func, idle=None,
+                        sound=True):
     """
     Display Windows logo splash screen with sound
     This plays when game first starts
+    idle: called every frame while the sound plays (non-blocking sound);
+          if it returns True the splash ends early
+    sound: False shows the logo for a moment without the chime
+    Returns True if idle() ended it early
     """
     splash = displayio.Group()
     bitmap = displayio.Bitmap(128, 64, 2)
@@ -24,16 +46,19 @@ def show_windows_splash(display, buzzer, play_windows_sound_func):
     center_x, center_y = 64, 24
     square_size, gap = 14, 6
     
-    for y in range(square_size):
-        for x in range(square_size):
-            # Top-left square
-            bitmap[center_x - square_size - gap//2 + x, center_y - square_size - gap//2 + y] = 1
-            # Top-right square
-            bitmap[center_x + gap//2 + x, center_y - square_size - gap//2 + y] = 1
-            # Bottom-left square
-            bitmap[center_x - square_size - gap//2 + x, center_y + gap//2 + y] = 1
-            # Bottom-right square
-            bitmap[center_x + gap//2 + x, center_y + gap//2 + y] = 1
+    left_x = center_x - square_size - gap//2
+    right_x = center_x + gap//2
+    top_y = center_y - square_size - gap//2
+    bottom_y = center_y + gap//2
+    
+    # Top-left square
+    fill_rect(bitmap, left_x, top_y, square_size, square_size)
+    # Top-right square
+    fill_rect(bitmap, right_x, top_y, square_size, square_size)
+    # Bottom-left square
+    fill_rect(bitmap, left_x, bottom_y, square_size, square_size)
+    # Bottom-right square
+    fill_rect(bitmap, right_x, bottom_y, square_size, square_size)
     
     tile_grid = displayio.TileGrid(bitmap, pixel_shader=palette)
     splash.append(tile_grid)
@@ -44,129 +69,131 @@ def show_windows_splash(display, buzzer, play_windows_sound_func):
     splash.append(text_label)
     
     display.root_group = splash
-    play_windows_sound_func(buzzer)
-    time.sleep(0.5)
+    if idle is None:
+        if sound:
+            play_windows_sound_func(buzzer)
+        time.sleep(0.5)
+        return False
+    
+    # Chime plays through a sequencer so idle() keeps running meanwhile
+    sequencer = SoundSequencer(buzzer)
+    if sound:
+        sequencer.play(SFX_WINDOWS)
+    next_frame = time.monotonic()
+    end = next_frame + 0.5
+    while sequencer.busy or time.monotonic() < end:
+        now = time.monotonic()
+        if now >= next_frame:
+            next_frame = now + FRAME_TIME
+            if idle():
+                sequencer.stop()
+                return True
+        sequencer.tick()
+        if sequencer.busy:
+            end = time.monotonic() + 0.5  # Hold the logo 0.5s after the chime
+        time.sleep(TICK_TIME)
+    return False
+
+def _hud_status(frame):
+    """Status text (3 lines, "" = blank) for a frame of the 60 frame HUD"""
+    if frame < 15:
+        return ("SYSTEMS", "INITIALIZING", "")  # First phase: initializing
+    if frame < 30:
+        return ("SYSTEMS", "ONLINE", "")        # Second phase: online
+    # Third phase: scanning with animated dots
+    scanning = _SCANNING[(frame // 5) % 4]
+    if frame > 45:
+        return (scanning, "TARGET", "ACQUIRED")  # Final phase: target acquired
+    return (scanning, "", "")
 
-def show_cockpit_hud_animation(display, buzzer, play_tone_func):
+def _open_frames(path):
+    """
+    Open a pre-rendered frame file (see hud_frames.py)
+    Returns (file, frame count) or (None, 0) to draw the frames live instead
+    """
+    if not path or not bitmaptools:
+        return None, 0
+    try:
+        f = open(path, "rb")
+    except OSError:
+        print(f"No {path}, drawing HUD animation live")
+        return None, 0
+    header = read_header(f)
+    if header is None or header[0] != 128 or header[1] != 64 or not header[2]:
+        print(f"{path} is not a 128x64 HUD frame file, drawing live")
+        f.close()
+        return None, 0
+    return f, header[2]
+
+def show_cockpit_hud_animation(display, buzzer, play_tone_func, idle=None,
+                               num_frames=60, frames_path=None):
     """
     Show cockpit HUD startup sequence with rotating radar
     Plays after Windows splash before main menu
+    idle: called every frame; if it returns True the animation ends early
+    num_frames: length (fewer frames = faster sweep, same phases)
+    frames_path: file from hud_frames.py - each frame is then just read
+                 into the bitmap instead of drawn
+    Returns True if idle() ended it early
     """
-    num_frames = 60
+    frame_file, file_frames = _open_frames(frames_path)
+    frame_size = frame_bytes(128, 64)
+    
+    # One screen reused by every frame: radar bitmap plus 3 text lines
+    hud = displayio.Group()
+    bitmap = displayio.Bitmap(128, 64, 2)
+    palette = displayio.Palette(2)
+    palette[0], palette[1] = 0x000000, 0xFFFFFF
+    hud.append(displayio.TileGrid(bitmap, pixel_shader=palette))
+    lines = []
+    for y in (20, 30, 40):
+        text = label.Label(terminalio.FONT, text="SYSTEMS", color=0xFFFFFF)
+        text.x, text.y = 70, y
+        text.hidden = True
+        hud.append(text)
+        lines.append(text)
+    display.root_group = hud
     
-    for frame in range(num_frames):
-        hud = displayio.Group()
-        bitmap = displayio.Bitmap(128, 64, 2)
-        palette = displayio.Palette(2)
-        palette[0], palette[1] = 0x000000, 0xFFFFFF
-        
-        # Draw corner targeting brackets
-        bracket_size = 8
-        # Top-left corner
-        for i in range(bracket_size):
-            bitmap[2+i, 2] = 1
-            bitmap[2, 2+i] = 1
-        # Top-right corner
-        for i in range(bracket_size):
-            bitmap[126-i, 2] = 1
-            bitmap[126, 2+i] = 1
-        # Bottom-left corner
-        for i in range(bracket_size):
-            bitmap[2+i, 62] = 1
-            bitmap[2, 62-i] = 1
-        # Bottom-right corner
-        for i in range(bracket_size):
-            bitmap[126-i, 62] = 1
-            bitmap[126, 62-i] = 1
-        
-        # Draw radar circle in center
-        radar_x, radar_y = 64, 28
-        radar_radius = 18
-        
-        # Draw circle outline using polar coordinates
-        for angle in range(0, 360, 10):
-            rad = math.radians(angle)
-            x = int(radar_x + radar_radius * math.cos(rad))
-            y = int(radar_y + radar_radius * math.sin(rad))
-            if 0 <= x < 128 and 0 <= y < 64:
-                bitmap[x, y] = 1
-        
-        # Draw center dot
-        for dx in range(-1, 2):
-            for dy in range(-1, 2):
-                if abs(dx) + abs(dy) <= 1:  # Plus shape
-                    bitmap[radar_x + dx, radar_y + dy] = 1
-        
-        # Draw rotating scan line
-        scan_angle = (frame / num_frames) * 360
-        rad = math.radians(scan_angle)
-        for r in range(radar_radius):
-            x = int(radar_x + r * math.cos(rad))
-            y = int(radar_y + r * math.sin(rad))
-            if 0 <= x < 128 and 0 <= y < 64:
-                bitmap[x, y] = 1
-        
-        # Add radar blips that appear near scan line
-        blip_angles = [30, 120, 200, 310]  # Fixed blip positions
-        blip_distances = [12, 15, 10, 14]
-        
-        for ba, bd in zip(blip_angles, blip_distances):
-            # Calculate angle difference
-            diff = abs(scan_angle - ba)
-            if diff > 180:
-                diff = 360 - diff
+    # Frame clock: frame n is due at start + n frame times, so slow frames
+    # are skipped instead of stretching the animation
+    start = time.monotonic_ns()
+    step = 0
+    try:
+        while step < num_frames:
+            # Phases are timed for 60 frames, shorter runs skip ahead
+            frame = step * 60 // num_frames
+            
+            if frame_file:
+                frame_file.seek(HEADER_SIZE + (step * file_frames // num_frames) * frame_size)
+                bitmaptools.readinto(bitmap, frame_file, 1)
+            else:
+                bitmap.fill(0)
+                draw_radar_frame(bitmap, frame)
+            
+            # Text labels only change at phase changes
+            for text, line in zip(lines, _hud_status(frame)):
+                if not line:
+                    text.hidden = True
+                    continue
+                if text.text != line:
+                    text.text = line
+                text.hidden = False
+            
+            # Play radar beeps periodically
+            if frame % 10 == 0:
+                play_tone_func(buzzer, 800 + (frame % 3) * 200, 0.02)
             
-            # Only show blip if scan line is nearby
-            if diff < 40:
-                rad = math.radians(ba)
-                bx = int(radar_x + bd * math.cos(rad))
-                by = int(radar_y + bd * math.sin(rad))
-                if 0 <= bx < 128 and 0 <= by < 64:
-                    # Draw blip as small cross
-                    bitmap[bx, by] = 1
-                    if bx-1 >= 0: bitmap[bx-1, by] = 1
-                    if bx+1 < 128: bitmap[bx+1, by] = 1
-        
-        tile_grid = displayio.TileGrid(bitmap, pixel_shader=palette)
-        hud.append(tile_grid)
-        
-        # Add status text that changes over time
-        if frame < 15:
-            # First phase: initializing
-            text = label.Label(terminalio.FONT, text="SYSTEMS", color=0xFFFFFF)
-            text.x, text.y = 70, 20
-            hud.append(text)
-            text2 = label.Label(terminalio.FONT, text="INITIALIZING", color=0xFFFFFF)
-            text2.x, text2.y = 70, 30
-            hud.append(text2)
-        elif frame < 30:
-            # Second phase: online
-            text = label.Label(terminalio.FONT, text="SYSTEMS", color=0xFFFFFF)
-            text.x, text.y = 70, 20
-            hud.append(text)
-            text2 = label.Label(terminalio.FONT, text="ONLINE", color=0xFFFFFF)
-            text2.x, text2.y = 70, 30
-            hud.append(text2)
-        else:
-            # Third phase: scanning with animated dots
-            dots = "." * ((frame // 5) % 4)
-            text = label.Label(terminalio.FONT, text=f"SCANNING{dots}", color=0xFFFFFF)
-            text.x, text.y = 70, 20
-            hud.append(text)
+            if idle and idle():
+                return True
             
-            # Final phase: target acquired
-            if frame > 45:
-                text2 = label.Label(terminalio.FONT, text="TARGET", color=0xFFFFFF)
-                text2.x, text2.y = 70, 30
-                hud.append(text2)
-                text3 = label.Label(terminalio.FONT, text="ACQUIRED", color=0xFFFFFF)
-                text3.x, text3.y = 70, 40
-                hud.append(text3)
-        
-        display.root_group = hud
-        
-        # Play radar beeps periodically
-        if frame % 10 == 0:
-            play_tone_func(buzzer, 800 + (frame % 3) * 200, 0.02)
-        
-        time.sleep(0.05)
\ No newline at end of file
+            step += 1
+            now = time.monotonic_ns()
+            due = start + step * FRAME_NS
+            if now < due:
+                time.sleep((due - now) / 1000000000)
+            else:
+                step = max(step, (now - start) // FRAME_NS)  # Running late
+    finally:
+        if frame_file:
+            frame_file.close()
+    return False
@@ -0,0 +1,214 @@
+# benchmarks.py
+# Timing helpers for picking settings per board
+# Run from the serial REPL, e.g.:
+#   import benchmarks
+#   benchmarks.grid_cache()
+#   benchmarks.entities()
+#   benchmarks.hud_text()
+#   benchmarks.i2c_bus()
+
+import gc
+import time
+import displayio
+from graphics import draw_grid
+from grid_cache import GridCache
+from game_objects import PooledEntities
+from entity_store import ArrayEntities
+from scene import GameScene, TEXT_LABELS, TEXT_BLIT
+
+def _ms_since(start_ns):
+    """Milliseconds elapsed since a time.monotonic_ns() timestamp"""
+    return (time.monotonic_ns() - start_ns) / 1000000
+
+def grid_cache(budgets=(0, 2048, 6144), step=4, frames=100):
+    """
+    Compare draw_grid() with GridCache at different memory budgets
+    Prints startup cost, memory used and per-frame time for each budget
+    """
+    bitmap = displayio.Bitmap(128, 64, 2)
+    
+    # Baseline: the original per-pixel draw_grid()
+    start = time.monotonic_ns()
+    for frame in range(frames):
+        bitmap.fill(0)
+        draw_grid(bitmap, frame * step)
+    base_ms = _ms_since(start) / frames
+    print(f"draw_grid: {base_ms:.2f} ms/frame")
+    
+    for budget in budgets:
+        gc.collect()
+        free_before = gc.mem_free()
+        
+        start = time.monotonic_ns()
+        cache = GridCache(step=step, max_bytes=budget)
+        build_ms = _ms_since(start)
+        used = free_before - gc.mem_free()
+        
+        start = time.monotonic_ns()
+        for frame in range(frames):
+            bitmap.fill(0)
+            cache.draw(bitmap, frame * step)
+        frame_ms = _ms_since(start) / frames
+        
+        saved_ms = base_ms - frame_ms
+        if saved_ms > 0:
+            payback = f"pays off after {int(build_ms / saved_ms) + 1} frames"
+        else:
+            payback = "no saving"
+        print(f"budget {budget}: mode={cache.mode} build={build_ms:.1f} ms "
+              f"mem={used} B {frame_ms:.2f} ms/frame ({payback})")
+        
+        del cache
+
+def _run_entities(world, count, frames, speed):
+    """Keep about count obstacles/bullets alive and time update + collide"""
+    start = time.monotonic_ns()
+    for frame in range(frames):
+        # Top both up so every frame does a full pass
+        lane = frame % 3
+        while world.obstacle_count < count and world.spawn_obstacle(lane):
+            lane = (lane + 1) % 3
+        while world.bullet_count < count and world.fire(lane):
+            lane = (lane + 1) % 3
+        world.update(speed)
+        world.collide()
+        world.hits_player(1)
+    return _ms_since(start) / frames
+
+def entities(counts=(8, 32, 128), frames=100, speed=2.0):
+    """
+    Compare the object pool backend with the structure-of-arrays backend
+    Prints ms/frame for spawn + update + cull + collision at each entity count
+    """
+    lanes = [40, 64, 88]
+    for count in counts:
+        gc.collect()
+        objects_ms = _run_entities(PooledEntities(lanes, count, count),
+                                   count, frames, speed)
+        gc.collect()
+        arrays_ms = _run_entities(ArrayEntities(lanes, count, count),
+                                  count, frames, speed)
+        print(f"{count} entities: objects={objects_ms:.2f} ms/frame "
+              f"arrays={arrays_ms:.2f} ms/frame")
+
+def hud_text(frames=200):
+    """
+    Compare Label HUD text with glyph-atlas blitting (HUD_TEXT in config.py)
+    Prints ms/frame with the score changing every frame and staying the same,
+    and the memory each scene takes
+    """
+    for mode in (TEXT_LABELS, TEXT_BLIT):
+        gc.collect()
+        free_before = gc.mem_free()
+        scene = GameScene(text_mode=mode)
+        used = free_before - gc.mem_free()
+        
+        start = time.monotonic_ns()
+        for frame in range(frames):
+            scene.set_score(frame * 10)
+            scene.show_tap(True, frame % 5 + 1)
+        changing_ms = _ms_since(start) / frames
+        
+        start = time.monotonic_ns()
+        for frame in range(frames):
+            scene.set_score(1230)
+            scene.show_tap(True, 3)
+        same_ms = _ms_since(start) / frames
+        
+        print(f"{mode}: mem={used} B changing={changing_ms:.3f} ms/frame "
+              f"unchanged={same_ms:.3f} ms/frame")
+        del scene
+
+def _stats(samples_ns):
+    """(mean, max) in ms of a list of nanosecond timings"""
+    return (sum(samples_ns) / len(samples_ns) / 1000000,
+            max(samples_ns) / 1000000)
+
+def i2c_bus(frames=50, reads=100):
+    """
+    Time the shared OLED/MPU-6050 I2C bus at the I2C_FREQUENCY in config.py
+    (change it and run again to compare speeds)
+    Prints full-frame display refresh time, accelerometer read latency on
+    an idle bus, a refresh plus a read in the same frame, and read latency
+    while displayio refreshes in the background
+    """
+    # Brings up the hardware (run from the REPL, not while the game runs)
+    from hardware import i2c, display, raw_display, accelerometer
+    from config import I2C_FREQUENCY
+    
+    frequency = getattr(i2c, "frequency", I2C_FREQUENCY)
+    # 1024 data bytes, 9 clocks per byte (8 bits + ack), no gaps between bytes
+    wire_ms = 1024 * 9 * 1000 / frequency
+    print(f"I2C at {frequency} Hz (a full frame is at least {wire_ms:.1f} ms on the wire)")
+    
+    # Screen that changes completely every frame
+    group = displayio.Group()
+    bitmap = displayio.Bitmap(128, 64, 2)
+    palette = displayio.Palette(2)
+    palette[0], palette[1] = 0x000000, 0xFFFFFF
+    group.append(displayio.TileGrid(bitmap, pixel_shader=palette))
+    display.auto_refresh = False
+    display.root_group = group
+    display.refresh()
+    
+    # Full-frame refresh through displayio
+    times = []
+    for frame in range(frames):
+        bitmap.fill(frame & 1)
+        start = time.monotonic_ns()
+        display.refresh()
+        times.append(time.monotonic_ns() - start)
+    refresh_mean, refresh_max = _stats(times)
+    print(f"displayio full refresh: mean={refresh_mean:.2f} ms max={refresh_max:.2f} ms")
+    
+    # Same through the raw driver (every page sent in full)
+    if raw_display:
+        raw_display.begin()
+        times = []
+        for frame in range(frames):
+            raw_display.bitmap.fill(frame & 1)
+            start = time.monotonic_ns()
+            raw_display.refresh()
+            times.append(time.monotonic_ns() - start)
+        raw_display.end()
+        display.auto_refresh = False
+        display.root_group = group
+        raw_mean, raw_max = _stats(times)
+        print(f"raw full refresh: mean={raw_mean:.2f} ms max={raw_max:.2f} ms")
+    
+    # Accelerometer reads with nothing else on the bus
+    times = []
+    for _ in range(reads):
+        start = time.monotonic_ns()
+        accelerometer.acceleration
+        times.append(time.monotonic_ns() - start)
+    read_mean, read_max = _stats(times)
+    print(f"accel read (idle bus): mean={read_mean:.2f} ms max={read_max:.2f} ms")
+    
+    # One refresh and one read per frame, like the game loop
+    times = []
+    for frame in range(frames):
+        bitmap.fill(frame & 1)
+        start = time.monotonic_ns()
+        display.refresh()
+        accelerometer.acceleration
+        times.append(time.monotonic_ns() - start)
+    both_mean, both_max = _stats(times)
+    print(f"refresh + read in one frame: mean={both_mean:.2f} ms max={both_max:.2f} ms "
+          f"(separately {refresh_mean + read_mean:.2f} ms)")
+    
+    # Reads while displayio refreshes on its own (waits for the bus lock)
+    display.auto_refresh = True
+    times = []
+    for frame in range(reads):
+        bitmap.fill(frame & 1)
+        start = time.monotonic_ns()
+        accelerometer.acceleration
+        times.append(time.monotonic_ns() - start)
+    busy_mean, busy_max = _stats(times)
+    print(f"accel read (background refresh): mean={busy_mean:.2f} ms max={busy_max:.2f} ms")
+    
+    if busy_max > 2 * read_max:
+        print("Reads wait behind display transfers - schedule them between refreshes")
+    else:
+        print("Little contention - read order within the frame doesn't matter")
@@ -0,0 +1,110 @@
+# blit.py
+# Small sprite/blit layer: clip once, then fill or copy whole regions
+# Uses bitmaptools (C code) when the board has it, plain Python otherwise
+# Bitmaps with their own region calls (ssd1306_raw.PageBitmap) do it themselves
+
+try:
+    import bitmaptools
+except ImportError:
+    bitmaptools = None  # Host tests / boards without bitmaptools
+
+def _clip(bitmap, x0, y0, x1, y1):
+    """
+    Clip a box (x1/y1 exclusive) to the bitmap
+    Returns the clipped box or None if it's fully off screen
+    """
+    if x0 < 0:
+        x0 = 0
+    if y0 < 0:
+        y0 = 0
+    if x1 > bitmap.width:
+        x1 = bitmap.width
+    if y1 > bitmap.height:
+        y1 = bitmap.height
+    if x0 >= x1 or y0 >= y1:
+        return None
+    return x0, y0, x1, y1
+
+def fill_rect(bitmap, x, y, width, height, value=1):
+    """
+    Fill a width x height rectangle with top-left corner at (x, y)
+    Parts outside the bitmap are skipped
+    """
+    box = _clip(bitmap, x, y, x + width, y + height)
+    if box is None:
+        return
+    x0, y0, x1, y1 = box
+    
+    if hasattr(bitmap, "fill_region"):
+        bitmap.fill_region(x0, y0, x1, y1, value)
+    elif bitmaptools:
+        bitmaptools.fill_region(bitmap, x0, y0, x1, y1, value)
+    else:
+        for py in range(y0, y1):
+            for px in range(x0, x1):
+                bitmap[px, py] = value
+
+def hline(bitmap, x, y, width, value=1):
+    """Horizontal span of width pixels starting at (x, y)"""
+    fill_rect(bitmap, x, y, width, 1, value)
+
+def vline(bitmap, x, y, height, value=1):
+    """Vertical span of height pixels starting at (x, y)"""
+    fill_rect(bitmap, x, y, 1, height, value)
+
+def copy_region(dest, source, x0, y0, x1, y1):
+    """
+    Copy the box (x0, y0)-(x1, y1) from source into the same place in dest
+    Both bitmaps must be the same size (used to restore backgrounds)
+    """
+    box = _clip(dest, x0, y0, x1, y1)
+    if box is None:
+        return
+    x0, y0, x1, y1 = box
+    
+    if hasattr(dest, "copy_region"):
+        dest.copy_region(source, x0, y0, x1, y1)
+    elif bitmaptools:
+        bitmaptools.blit(dest, source, x0, y0, x1=x0, y1=y0, x2=x1, y2=y1)
+    else:
+        for py in range(y0, y1):
+            for px in range(x0, x1):
+                dest[px, py] = source[px, py]
+
+def blit(dest, sprite, x, y, transparent=True):
+    """
+    Draw a whole sprite bitmap with its top-left corner at (x, y)
+    transparent: skip pixels that are 0 in the sprite (draw on top)
+    """
+    blit_region(dest, sprite, x, y, 0, 0, sprite.width, sprite.height, transparent)
+
+def blit_region(dest, source, x, y, sx0, sy0, sx1, sy1, transparent=True):
+    """
+    Draw the box (sx0, sy0)-(sx1, sy1) of source with its top-left corner
+    at (x, y) in dest (e.g. one glyph out of a font atlas)
+    transparent: skip pixels that are 0 in the source (draw on top)
+    """
+    box = _clip(dest, x, y, x + sx1 - sx0, y + sy1 - sy0)
+    if box is None:
+        return
+    x0, y0, x1, y1 = box
+    
+    # Matching area inside the source
+    sx0, sy0 = sx0 + x0 - x, sy0 + y0 - y
+    sx1, sy1 = sx0 + x1 - x0, sy0 + y1 - y0
+    
+    if hasattr(dest, "blit_region"):
+        dest.blit_region(source, x0, y0, sx0, sy0, sx1, sy1, transparent)
+    elif bitmaptools and not hasattr(source, "blit_region"):
+        if transparent:
+            bitmaptools.blit(dest, source, x0, y0, x1=sx0, y1=sy0, x2=sx1, y2=sy1,
+                             skip_source_index=0)
+        else:
+            bitmaptools.blit(dest, source, x0, y0, x1=sx0, y1=sy0, x2=sx1, y2=sy1)
+    else:
+        dx, dy = x0 - sx0, y0 - sy0
+        for sy in range(sy0, sy1):
+            for sx in range(sx0, sx1):
+                value = source[sx, sy]
+                if value or not transparent:
+                    dest[sx + dx, sy + dy] = value
@@ -3,33 +3,98 @@
 # This is the entry point for my game
 # Hardware: ESP32-C3, OLED display, MPU-6050, rotary encoder, buttons
 
-import displayio
-import terminalio
-from adafruit_display_text import label
 import time
+boot_start = time.monotonic()  # Start of code.py, for the time-to-menu report
+
 import random
+import gc
 
 # Import my custom modules
-from hardware import (display, accelerometer, buzzer, encoder, encoder_btn,
-                     button_a, button_c, button_d, set_neopixel, hsv_to_rgb)
-from sounds import (play_tone, sound_selection, sound_blaster, sound_dodge,
-                   sound_game_over, sound_victory, play_windows_sound)
+from hardware import (display, raw_display, accelerometer, accel_int, buzzer,
+                     audio_out, encoder, encoder_btn, controls, set_neopixel)
+from controls import BIT_A, BIT_C, BIT_D
+from sounds import (sound_selection, sound_game_over,
+                    SoundSequencer, SFX_BLASTER, SFX_DODGE, SFX_VICTORY,
+                    SFX_WINDOWS, PRIORITY_BLASTER, PRIORITY_DODGE,
+                    PRIORITY_VICTORY, use_samples)
 from accelerometer_filter import AccelerometerTapDetector
-from game_objects import Obstacle, Bullet
-from graphics import (draw_grid, draw_hud, draw_targeting_reticle, draw_player,
-                     check_collision)
-from animations import show_windows_splash, show_cockpit_hud_animation
-from menu import (show_menu, load_highscores, save_highscores, is_highscore,
-                 get_initials)
+from game_objects import PooledEntities
+from entity_store import ArrayEntities
+from graphics import draw_hud, draw_targeting_reticle, draw_player
+from startup import run_startup
+from scene import GameScene
+from renderer import DirtyRectRenderer
+from grid_cache import GridCache
+from sprites import SpriteLayer
+from frame_scheduler import FrameScheduler
+from led_effects import LedEffects
+from profiler import (FrameProfiler, STAGE_INPUT, STAGE_ACCEL, STAGE_EFFECTS,
+                      STAGE_UPDATE, STAGE_COLLISION, STAGE_DRAW, STAGE_HUD,
+                      STAGE_SLEEP, STAGE_REFRESH)
+from config import (RENDER_MODE, MEMORY_REPORT_FRAMES, GRID_SCROLL_STEP,
+                    GRID_CACHE_BYTES, TARGET_FPS, LED_FLASH_TIME, PROFILE_FRAMES,
+                    AUDIO_SAMPLE_BYTES, OBSTACLE_POOL_SIZE, BULLET_POOL_SIZE,
+                    POOL_OVERFLOW, ENTITY_BACKEND, TAP_MODE, CALIBRATION_FAST,
+                    BOOT_MODE, HUD_FRAMES_FILE, HUD_TEXT)
 
-# Initialize and calibrate accelerometer tap detector
-tap_detector = AccelerometerTapDetector(accelerometer)
-tap_detector.calibrate(num_samples=30)
+# Pre-render sound effects for DMA playback (only if audiopwmio is available)
+if audio_out:
+    from sample_audio import SampleBank, SamplePlayer
+    sample_bank = SampleBank([SFX_BLASTER, SFX_DODGE, SFX_VICTORY, SFX_WINDOWS],
+                             max_bytes=AUDIO_SAMPLE_BYTES)
+    use_samples(SamplePlayer(audio_out, sample_bank))
 
-# Show startup animations
+# Show startup animations while the accelerometer calibrates
+tap_detector = AccelerometerTapDetector(accelerometer, mode=TAP_MODE, int_pin=accel_int)
 set_neopixel(255, 255, 255)  # White LED during startup
-show_windows_splash(display, buzzer, play_windows_sound)
-show_cockpit_hud_animation(display, buzzer, play_tone)
+run_startup(display, buzzer, controls, tap_detector, BOOT_MODE, CALIBRATION_FAST,
+            HUD_FRAMES_FILE)
+
+# Gameplay scene is built once and reused by every game
+# (with the raw driver it draws straight into the driver's framebuffer)
+scene = GameScene(text_mode=HUD_TEXT, raw=raw_display)
+grid_cache = GridCache(step=GRID_SCROLL_STEP, max_bytes=GRID_CACHE_BYTES,
+                       bitmap_type=type(scene.bitmap) if raw_display else None)
+renderer = DirtyRectRenderer(scene.bitmap, grid_cache)
+
+# Sprite mode: moving things are TileGrids composited by displayio
+sprites = None
+if RENDER_MODE == "sprites" and raw_display:
+    print("Sprite render mode needs displayio, redrawing full frames instead")
+elif RENDER_MODE == "sprites":
+    # One TileGrid per pool slot, so a live entity always has a sprite
+    sprites = SpriteLayer(OBSTACLE_POOL_SIZE, BULLET_POOL_SIZE)
+    scene.add_layer(sprites.group)
+
+# Obstacles and bullets (allocated once, recycled for every game)
+player_lanes = [40, 64, 88]  # X-coordinates of 3 lanes
+if ENTITY_BACKEND == "arrays" and not sprites:
+    entities = ArrayEntities(player_lanes, OBSTACLE_POOL_SIZE, BULLET_POOL_SIZE)
+else:
+    entities = PooledEntities(player_lanes, OBSTACLE_POOL_SIZE, BULLET_POOL_SIZE,
+                              POOL_OVERFLOW, sprites)
+
+# Non-blocking sound effects and LED effects during gameplay
+sequencer = SoundSequencer(buzzer)
+leds = LedEffects()
+
+# Frame pacing (also drives display refreshes during gameplay)
+scheduler = FrameScheduler(raw_display or display, fps=TARGET_FPS)
+
+# Optional per-stage profiler (None when off, so it costs nothing)
+profiler = FrameProfiler(PROFILE_FRAMES) if PROFILE_FRAMES else None
+if profiler:
+    print("Profiler on - type 'p' on the serial console for a report")
+
+# Menu screens aren't needed until now (imported after the startup animations)
+from menu import (show_menu, load_highscores, save_highscores, is_highscore,
+                 get_initials, show_game_over)
+from screens import screen_cache
+
+# Put the menu up now (show_menu() reuses it) so the report ends when it shows
+# Only time spent in code.py is counted, not the board's own startup before it
+display.root_group = screen_cache.menu.group
+print(f"code.py start to menu: {int((time.monotonic() - boot_start) * 1000)} ms")
 
 # MAIN GAME LOOP
 # This runs forever, returning to menu after each game
@@ -59,8 +124,7 @@ while True:
     print(f"Starting game - Difficulty: {difficulty}, Speed: {starting_speed}, Level: {starting_level}, Multiplier: {score_multiplier}x")
     
     # GAME STATE VARIABLES
-    # Player position
-    player_lanes = [40, 64, 88]  # X-coordinates of 3 lanes
+    # Player position (lanes are player_lanes, set up once above)
     player_lane_index = 1  # Start in middle lane
     
     # Scoring and progression
@@ -82,55 +146,55 @@ while True:
     VICTORY_DURATION = 3.0
     
     # Set LED to white for normal gameplay
-    set_neopixel(255, 255, 255)
+    leds.reset((255, 255, 255))
     
-    # Game entity lists
-    obstacles = []
-    bullets = []
+    # Empty the entity pools
+    entities.clear()
     
     # Obstacle spawning
     spawn_timer = 0
     spawn_delay = 30  # Frames between obstacles
     
-    # Button state tracking (for edge detection)
-    button_a_last = False
-    button_c_last = False
-    button_d_last = False
+    # Drop button presses left over from the menu
+    controls.clear()
+    
+    # Reset the reusable scene and show it
+    scene.reset()
+    renderer.invalidate()
+    if sprites:
+        sprites.reset()
+    if raw_display:
+        raw_display.begin()  # Game draws to the panel directly from here on
+    else:
+        display.root_group = scene.group
+    gc.collect()
+    report_time = time.monotonic()
+    scheduler.start()
+    if profiler:
+        profiler.reset()
     
     # GAME LOOP
     # Runs until player dies or quits
     while not game_over:
         frame_count += 1
+        if profiler:
+            profiler.start_frame()
+        
+        # Read every button event since last frame (keypad queues them,
+        # so even presses shorter than a frame are seen)
+        pressed = controls.poll()
         
         # Check for quit (all 3 buttons pressed)
-        if button_a.value and button_c.value and button_d.value:
+        if controls.chord:
             print("Returning to menu...")
             break
         
-        # VICTORY MODE HANDLING
-        # Flash rainbow LED when level 10 reached
-        if victory_mode:
-            elapsed = time.monotonic() - victory_start_time
-            if elapsed >= VICTORY_DURATION:
-                # Victory display over, return to normal
-                victory_mode = False
-                set_neopixel(255, 255, 255)
-                print("Victory mode ended")
-            else:
-                # Rainbow LED effect
-                hue = (frame_count * 10) % 360
-                r, g, b = hsv_to_rgb(hue, 1.0, 1.0)
-                set_neopixel(r, g, b)
+        if profiler:
+            profiler.mark(STAGE_INPUT)
         
         # LEVEL UP TAP MECHANIC
-        # Screen inverts, player must tap to continue
+        # Screen inverts, player must tap to continue (LED blinks white/black)
         if waiting_for_tap:
-            # Flash LED white/black
-            if frame_count % 3 == 0:
-                set_neopixel(255, 255, 255)
-            else:
-                set_neopixel(0, 0, 0)
-            
             # Check timeout
             elapsed = time.monotonic() - tap_start_time
             time_left = TAP_TIMEOUT - elapsed
@@ -145,92 +209,85 @@ while True:
                 # Tap detected! Continue game
                 inverted = False
                 waiting_for_tap = False
-                set_neopixel(255, 255, 255)
+                leds.stop_blink()
                 print(f"Level {speed_level} complete!")
+            
+            if profiler:
+                profiler.mark(STAGE_ACCEL)
+        
+        # VICTORY MODE HANDLING
+        # Rainbow LED runs by itself (see LedEffects), just end the message
+        if victory_mode:
+            elapsed = time.monotonic() - victory_start_time
+            if elapsed >= VICTORY_DURATION:
+                # Victory display over, return to normal
+                victory_mode = False
+                print("Victory mode ended")
+        
+        # Advance any sound or LED effect that's running
+        sequencer.tick()
+        leds.tick()
+        
+        if profiler:
+            profiler.mark(STAGE_EFFECTS)
         
         # NORMAL GAMEPLAY
         if not waiting_for_tap:
             # PLAYER CONTROLS
-            # Detect button press edges (only trigger once per press)
-            button_a_pressed = button_a.value and not button_a_last
-            button_c_pressed = button_c.value and not button_c_last
-            button_d_pressed = button_d.value and not button_d_last
-            
-            # Update button states for next frame
-            button_a_last = button_a.value
-            button_c_last = button_c.value
-            button_d_last = button_d.value
+            # Presses since last frame (each press only triggers once)
+            button_a_pressed = pressed & BIT_A
+            button_c_pressed = pressed & BIT_C
+            button_d_pressed = pressed & BIT_D
             
             # Button A - Move left
             if button_a_pressed and player_lane_index > 0:
                 player_lane_index -= 1
-                if not victory_mode:
-                    set_neopixel(0, 0, 255)  # Blue flash
-                sound_dodge(buzzer)
-                time.sleep(0.05)
-                if not victory_mode:
-                    set_neopixel(255, 255, 255)
+                leds.flash((0, 0, 255), LED_FLASH_TIME)  # Blue flash
+                sequencer.play(SFX_DODGE, PRIORITY_DODGE)
             
             # Button C - Move right
             if button_c_pressed and player_lane_index < 2:
                 player_lane_index += 1
-                if not victory_mode:
-                    set_neopixel(0, 0, 255)  # Blue flash
-                sound_dodge(buzzer)
-                time.sleep(0.05)
-                if not victory_mode:
-                    set_neopixel(255, 255, 255)
+                leds.flash((0, 0, 255), LED_FLASH_TIME)  # Blue flash
+                sequencer.play(SFX_DODGE, PRIORITY_DODGE)
             
             # Button D - Shoot
             if button_d_pressed:
-                bullets.append(Bullet(player_lanes[player_lane_index], 56))
-                if not victory_mode:
-                    set_neopixel(0, 255, 0)  # Green flash
-                sound_blaster(buzzer)
-                time.sleep(0.05)
-                if not victory_mode:
-                    set_neopixel(255, 255, 255)
+                entities.fire(player_lane_index)
+                leds.flash((0, 255, 0), LED_FLASH_TIME)  # Green flash
+                sequencer.play(SFX_BLASTER, PRIORITY_BLASTER)
+            
+            if profiler:
+                profiler.mark(STAGE_INPUT)
             
             # OBSTACLE SPAWNING
             spawn_timer += 1
             if spawn_timer >= spawn_delay:
                 spawn_timer = 0
                 lane = random.randint(0, 2)
-                obstacles.append(Obstacle(lane, player_lanes))
+                entities.spawn_obstacle(lane)
             
-            # UPDATE BULLETS
-            for bullet in bullets[:]:
-                bullet.update()
-                if not bullet.active:
-                    bullets.remove(bullet)
+            # UPDATE BULLETS AND OBSTACLES
+            # Award points for every obstacle the player dodged
+            dodged = entities.update(speed)
+            if dodged:
+                score += dodged * int(10 * score_multiplier)
             
-            # UPDATE OBSTACLES
-            for obs in obstacles[:]:
-                passed = obs.update(speed)
-                if passed:
-                    # Player dodged obstacle - award points
-                    points = int(10 * score_multiplier)
-                    score += points
-                if not obs.active:
-                    obstacles.remove(obs)
+            if profiler:
+                profiler.mark(STAGE_UPDATE)
             
             # BULLET-OBSTACLE COLLISION
-            for bullet in bullets[:]:
-                for obs in obstacles[:]:
-                    if obs.active and bullet.active:
-                        # Simple distance check
-                        if abs(bullet.x - obs.x) < 8 and abs(bullet.y - obs.y) < 8:
-                            bullet.active = False
-                            if obs.hit():
-                                # Obstacle destroyed - award bonus points
-                                points = int(20 * score_multiplier)
-                                score += points
+            # Destroyed obstacles award bonus points
+            destroyed = entities.collide()
+            if destroyed:
+                score += destroyed * int(20 * score_multiplier)
             
             # PLAYER-OBSTACLE COLLISION
-            if check_collision(player_lane_index, player_lanes, obstacles):
+            if entities.hits_player(player_lane_index):
                 game_over = True
-                set_neopixel(255, 0, 0)  # Red LED
-                sound_game_over(buzzer)
+                leds.reset((255, 0, 0))  # Red LED
+                sequencer.stop()
+                sound_game_over(buzzer)  # Game has ended, so blocking is fine
             
             # LEVEL PROGRESSION
             # Every 100 points = next level
@@ -242,13 +299,15 @@ while True:
                 if speed_level >= 10 and not victory_mode:
                     victory_mode = True
                     victory_start_time = time.monotonic()
-                    sound_victory(buzzer)
+                    leds.rainbow(VICTORY_DURATION)
+                    sequencer.play(SFX_VICTORY, PRIORITY_VICTORY)
                     print("YOU WIN! Level 10 reached!")
                 
                 # Trigger level-up sequence
                 inverted = True
                 waiting_for_tap = True
                 tap_start_time = time.monotonic()
+                leds.blink((255, 255, 255), (0, 0, 0))
                 tap_detector.reset_for_level()
             
             # DIFFICULTY SCALING
@@ -257,73 +316,85 @@ while True:
                 if score > 0 and score % 100 == 0:
                     spawn_delay -= 1  # Spawn obstacles faster
                     speed += 0.2  # Move obstacles faster
+            
+            if profiler:
+                profiler.mark(STAGE_COLLISION)
         
         # RENDER FRAME
-        # Draw everything to screen
-        game_screen = displayio.Group()
-        bitmap = displayio.Bitmap(128, 64, 2)
-        palette = displayio.Palette(2)
+        scene.set_inverted(inverted)
+        bitmap = scene.bitmap
         
-        # Set colors (inverted during level-up)
-        if inverted:
-            palette[0], palette[1] = 0xFFFFFF, 0x000000
+        if sprites:
+            # Entities already moved their TileGrids in update()
+            # Only the background grid needs drawing
+            sprites.set_inverted(inverted)
+            sprites.place_player(player_lane_index, player_lanes)
+            renderer.begin_frame(frame_count * GRID_SCROLL_STEP)
+            renderer.end_frame()
+        elif RENDER_MODE == "dirty":
+            # Only erase/redraw what moved since last frame
+            renderer.begin_frame(frame_count * GRID_SCROLL_STEP)
+            entities.draw_tracked(renderer)
+            renderer.draw_player(player_lane_index, player_lanes)
+            renderer.end_frame()
         else:
-            palette[0], palette[1] = 0x000000, 0xFFFFFF
-        
-        # Draw background elements
-        draw_grid(bitmap, frame_count * 4)  # Animated grid
-        draw_targeting_reticle(bitmap)
-        draw_hud(bitmap)
-        
-        # Draw game entities
-        for obs in obstacles:
-            obs.draw(bitmap)
-        
-        for bullet in bullets:
-            bullet.draw(bitmap)
-        
-        draw_player(bitmap, player_lane_index, player_lanes)
-        
-        # Add bitmap to display group
-        tile_grid = displayio.TileGrid(bitmap, pixel_shader=palette)
-        game_screen.append(tile_grid)
-        
-        # Choose text color based on inversion
-        text_color = 0x000000 if inverted else 0xFFFFFF
-        
-        # Display victory message
-        if victory_mode:
-            win_label = label.Label(terminalio.FONT, text="YOU WIN!", color=text_color)
-            win_label.x, win_label.y = 42, 4
-            game_screen.append(win_label)
+            # Clear and redraw everything
+            scene.clear()
+            
+            # Draw background elements
+            grid_cache.draw(bitmap, frame_count * GRID_SCROLL_STEP)  # Animated grid
+            draw_targeting_reticle(bitmap)
+            draw_hud(bitmap)
+            
+            # Draw game entities
+            entities.draw(bitmap)
+            
+            draw_player(bitmap, player_lane_index, player_lanes)
         
-        # Display score
-        score_label = label.Label(terminalio.FONT, text=f"SC:{score}", color=text_color)
-        score_label.x, score_label.y = 4, 8
-        game_screen.append(score_label)
+        if profiler:
+            profiler.mark(STAGE_DRAW)
         
-        # Display level
-        speed_label = label.Label(terminalio.FONT, text=f"LVL:{speed_level}", color=text_color)
-        speed_label.x, speed_label.y = 92, 8
-        game_screen.append(speed_label)
+        # Update HUD text (labels only change when the value changes)
+        scene.show_win(victory_mode)
+        scene.set_score(score)
+        scene.set_level(speed_level)
         
-        # Display tap prompt during level-up
+        # Display tap prompt and countdown during level-up
         if waiting_for_tap:
             elapsed = time.monotonic() - tap_start_time
             time_left = max(0, TAP_TIMEOUT - elapsed)
-            
-            tap_label = label.Label(terminalio.FONT, text="TAP!", color=text_color)
-            tap_label.x, tap_label.y = 50, 28
-            game_screen.append(tap_label)
-            
-            # Countdown timer
-            timer_label = label.Label(terminalio.FONT, text=f"{int(time_left) + 1}", color=text_color)
-            timer_label.x, timer_label.y = 60, 40
-            game_screen.append(timer_label)
+            scene.show_tap(True, int(time_left) + 1)
+        else:
+            scene.show_tap(False)
         
-        # Show frame on display
-        display.root_group = game_screen
-        time.sleep(0.02)  # ~50 FPS
+        if profiler:
+            profiler.mark(STAGE_HUD)
+        
+        # Sleep whatever is left of the frame, then refresh the display
+        scheduler.wait()
+        if profiler:
+            profiler.mark(STAGE_SLEEP)
+        scheduler.refresh()
+        if profiler:
+            profiler.mark(STAGE_REFRESH)
+            profiler.end_frame()
+            profiler.poll_serial()
+        
+        # Memory/frame time report for checking heap drift
+        # (after end_frame, so the print isn't counted in any stage)
+        if MEMORY_REPORT_FRAMES and frame_count % MEMORY_REPORT_FRAMES == 0:
+            now = time.monotonic()
+            frame_ms = (now - report_time) * 1000 / MEMORY_REPORT_FRAMES
+            report_time = now
+            print(f"Frame {frame_count}: {frame_ms:.1f} ms/frame, mem_free={gc.mem_free()}")
+    
+    scheduler.stop()
+    scheduler.report()
+    if raw_display:
+        raw_display.end()  # Back to displayio for the menus
+    sequencer.stop()
+    if profiler:
+        profiler.report()
     
     # GAME OVER
     # Check if we exited due to quit (return to menu immediately)
@@ -345,28 +416,9 @@ while True:
         save_highscores(highscores)
     
     # GAME OVER SCREEN
-    # Flash game over message 3 times
-    for _ in range(3):
-        game_over_screen = displayio.Group()
-        bitmap = displayio.Bitmap(128, 64, 2)
-        palette = displayio.Palette(2)
-        palette[0], palette[1] = 0x000000, 0xFFFFFF
-        
-        tile_grid = displayio.TileGrid(bitmap, pixel_shader=palette)
-        game_over_screen.append(tile_grid)
-        
-        # "GAME OVER" text
-        game_over_label = label.Label(terminalio.FONT, text="GAME OVER", color=0xFFFFFF)
-        game_over_label.x, game_over_label.y = 34, 24
-        game_over_screen.append(game_over_label)
-        
-        # Final score
-        score_label = label.Label(terminalio.FONT, text=f"Score: {score}", color=0xFFFFFF)
-        score_label.x, score_label.y = 38, 40
-        game_over_screen.append(score_label)
-        
-        display.root_group = game_over_screen
-        set_neopixel(255, 0, 0)  # Red LED
-        time.sleep(1)
+    # Prebuilt screen, just shows the final score for 3 seconds
+    show_game_over(display, score)
+    set_neopixel(255, 0, 0)  # Red LED
+    time.sleep(3)
     
     # Loop back to menu
\ No newline at end of file
@@ -0,0 +1,87 @@
+# config.py
+# Tunable settings for my game in one place
+# Change these and reset the board to try different options
+
+# Gameplay rendering
+# "dirty" = only erase/redraw the boxes entities moved through. Only saves
+#           drawing and I2C traffic while the grid stands still
+#           (GRID_SCROLL_STEP = 0): a scrolling grid changes rows 20-63
+#           every frame, so those are recopied and sent every frame anyway
+# "full"  = clear and redraw the whole screen every frame (original behavior)
+# "sprites" = obstacles, bullets and ship are TileGrids moved by displayio
+RENDER_MODE = "dirty"
+
+# Gameplay HUD text (score, level, TAP!, countdown, YOU WIN!)
+# "labels" = a Label per item (original behavior)
+# "blit"   = glyphs pre-rendered once and copied into an overlay bitmap
+HUD_TEXT = "labels"
+
+# Display driver during gameplay (menus always use displayio)
+# "displayio" = displayio + adafruit_displayio_ssd1306 (original behavior)
+# "raw"       = ssd1306_raw.py: own 1 KB framebuffer, only changed bytes sent
+#               (HUD text is always blitted, "sprites" render mode not available)
+DISPLAY_DRIVER = "displayio"
+
+# Shared I2C bus (OLED + MPU-6050), in Hz: 100000 (default), 400000 or 1000000
+# The MPU-6050 is only rated for 400 kHz; check benchmarks.i2c_bus() at each speed
+I2C_FREQUENCY = 100000
+
+# Entity storage
+# "objects" = pooled Obstacle/Bullet instances (needed for sprite render mode)
+# "arrays"  = structure-of-arrays columns with batched update/collision passes
+ENTITY_BACKEND = "objects"
+
+# Entity pools (preallocated, no allocations during play)
+# Sprite render mode makes one TileGrid per pool slot, so every entity is visible
+OBSTACLE_POOL_SIZE = 8   # Max obstacles on screen
+BULLET_POOL_SIZE = 12    # Max bullets on screen
+POOL_OVERFLOW = "drop"   # Pool full: "drop" the new one or "recycle" the oldest
+
+# Rotary encoder decoding
+# True  = rotaryio counts steps in the background (falls back automatically)
+# False = Python state machine (update() must be called very often)
+ENCODER_HARDWARE = True
+
+# Level-up tap detection
+# "polled" = one accelerometer read per frame (original behavior)
+# "fifo"   = sensor samples at a fixed rate into its FIFO, drained once per frame
+# "motion" = sensor's motion interrupt detects the tap (no filtering on our side)
+TAP_MODE = "polled"
+ACCEL_INT_PIN = None  # Board pin wired to MPU-6050 INT, e.g. "D9" (motion mode)
+
+# Accelerometer calibration is saved in NVM and only checked at boot;
+# it's redone when there's no saved one or it has drifted
+CALIBRATION_FAST = False  # True = sample at the sensor's rate instead of every 50ms
+
+# Startup sequence (calibration runs in the background while it plays)
+# "full"  = Windows splash with chime, then the 3 second cockpit HUD
+# "short" = silent splash and a 1 second HUD
+# "skip"  = straight to the menu (calibration still finishes first)
+# Pressing any button during the animations skips the rest of them
+BOOT_MODE = "full"
+# Pre-rendered HUD animation made with hud_frames.py on a PC (60 KB),
+# e.g. "/sd/hud_frames.bin" on an SD card; drawn live if the file is missing
+HUD_FRAMES_FILE = "/hud_frames.bin"
+
+# Frame pacing
+TARGET_FPS = 50          # Game loop frame rate (display refreshes once per frame)
+LED_FLASH_TIME = 0.05    # Seconds the LED stays blue/green after a button press
+
+# Sound output
+# "tone"    = PWM frequency changes (original behavior, works everywhere)
+# "samples" = pre-rendered effects played by audiopwmio (falls back to tone
+#             automatically if the board has no audiopwmio)
+AUDIO_BACKEND = "tone"
+AUDIO_SAMPLE_BYTES = 16384  # Memory budget for pre-rendered effects (8 kHz, 8-bit)
+
+# Per-stage frame profiler: number of recent frames to keep (0 = off)
+# Report prints at game over, or type 'p' on the serial console
+PROFILE_FRAMES = 0
+
+# Print frame time and gc.mem_free() every N frames (0 = off)
+MEMORY_REPORT_FRAMES = 0
+
+# Background grid
+GRID_SCROLL_STEP = 4      # Grid offset added per frame (scroll speed, 0 = still)
+GRID_CACHE_BYTES = 6144   # Memory budget for precomputed grid frames (0 = no cache)
+                          # Run benchmarks.grid_cache() to pick a size per board
@@ -0,0 +1,194 @@
+# controls.py
+# Button input as a queue of press/release events
+# keypad scans and debounces the pins in the background, so short presses
+# (or presses during a blocking sound) are never missed between frames
+
+import supervisor
+
+try:
+    import keypad
+except ImportError:
+    keypad = None  # Fall back to polling DigitalInOut pins
+    import digitalio
+
+# Key numbers
+KEY_A = 0        # Move left
+KEY_C = 1        # Move right
+KEY_D = 2        # Shoot
+KEY_ENCODER = 3  # Encoder push button
+
+# Bit masks for pressed()/down, e.g. pressed & BIT_A
+BIT_A = 1 << KEY_A
+BIT_C = 1 << KEY_C
+BIT_D = 1 << KEY_D
+BIT_ENCODER = 1 << KEY_ENCODER
+
+QUIT_CHORD = BIT_A | BIT_C | BIT_D  # All three game buttons = back to menu
+
+SCAN_INTERVAL = 0.02  # Seconds between scans (also the debounce time)
+_TICKS_MASK = 0x1FFFFFFF  # supervisor.ticks_ms() wraps at 2**29
+
+def ticks_diff(end, start):
+    """Milliseconds between two supervisor.ticks_ms() / event timestamps"""
+    return (end - start) & _TICKS_MASK
+
+class Controls:
+    """
+    Game buttons (pull-down, high when pressed) and the encoder button
+    (pull-up, low when pressed) merged into one event stream
+    Game loop: call poll() once per frame, it returns a bit mask of keys
+    pressed since the last poll. down is the mask of keys held right now
+    Menus that still poll pin levels can use key(KEY_...).value
+    """
+
+    def __init__(self, button_pins, encoder_pin, interval=SCAN_INTERVAL):
+        """
+        button_pins: pins for KEY_A, KEY_C, KEY_D (in that order)
+        encoder_pin: pin for the encoder push button
+        interval: scan/debounce interval in seconds
+        """
+        self.key_count = len(button_pins) + 1
+        self.down = 0           # Keys held right now (bit mask)
+        self._pending = 0       # Presses not yet returned by poll()
+        self._released = 0      # Releases not yet taken by take_release()
+        self._chord = False     # QUIT_CHORD was held at some point since poll()
+        self.chord = False      # Result for this frame (set by poll())
+
+        # Timestamps (supervisor.ticks_ms) of the last press, and how long
+        # the last completed press was held, per key
+        self.press_ms = [0] * self.key_count
+        self.held_ms = [0] * self.key_count
+
+        if keypad:
+            # keypad.Keys can't mix pull directions, so one scanner per polarity
+            self._buttons = keypad.Keys(button_pins, value_when_pressed=True,
+                                        pull=True, interval=interval)
+            self._encoder = keypad.Keys((encoder_pin,), value_when_pressed=False,
+                                        pull=True, interval=interval)
+            self._event = keypad.Event()  # Reused by get_into(), no allocation
+        else:
+            self._pins = []
+            for pin in button_pins:
+                self._pins.append(self._make_pin(pin, digitalio.Pull.DOWN))
+            self._pins.append(self._make_pin(encoder_pin, digitalio.Pull.UP))
+            self._levels = 0
+
+    @staticmethod
+    def _make_pin(pin, pull):
+        """Input pin for the polling fallback"""
+        io = digitalio.DigitalInOut(pin)
+        io.direction = digitalio.Direction.INPUT
+        io.pull = pull
+        return io
+
+    def _apply(self, key, pressed, timestamp):
+        """Fold one press/release event into the key state"""
+        bit = 1 << key
+        if pressed:
+            self.down |= bit
+            self._pending |= bit
+            self.press_ms[key] = timestamp
+            if self.down & QUIT_CHORD == QUIT_CHORD:
+                self._chord = True
+        else:
+            self.down &= ~bit
+            self._released |= bit
+            self.held_ms[key] = ticks_diff(timestamp, self.press_ms[key])
+
+    @property
+    def background(self):
+        """True if keypad scans the pins by itself (no need to poll quickly)"""
+        return keypad is not None
+
+    def _drain(self, keys, offset):
+        """Apply every queued event from one keypad scanner, returns how many"""
+        event = self._event
+        events = keys.events
+        if events.overflowed:
+            # Lost events: start over from the real pin states
+            # (reset() queues a press for every key that's still held)
+            events.clear()
+            keys.reset()
+            self.down &= ~(((1 << keys.key_count) - 1) << offset)
+        count = 0
+        while events.get_into(event):
+            self._apply(event.key_number + offset, event.pressed, event.timestamp)
+            count += 1
+        return count
+
+    def update(self):
+        """
+        Read new events into down/pending (cheap, safe to call any time)
+        Returns True if anything was pressed or released
+        """
+        if keypad:
+            count = self._drain(self._buttons, 0)
+            count += self._drain(self._encoder, KEY_ENCODER)
+            return count > 0
+
+        # Polling fallback: diff the pin levels against the last scan
+        now = supervisor.ticks_ms()
+        changed = False
+        for key, io in enumerate(self._pins):
+            pressed = io.value if key != KEY_ENCODER else not io.value
+            bit = 1 << key
+            if pressed != bool(self._levels & bit):
+                self._levels ^= bit
+                self._apply(key, pressed, now)
+                changed = True
+        return changed
+
+    def poll(self):
+        """
+        Drain the event queues - call once per frame
+        Returns a bit mask of keys pressed since the last poll()
+        Also sets chord if the quit chord was held in that time
+        """
+        self.update()
+        pressed = self._pending
+        self._pending = 0
+        self.chord = self._chord
+        self._chord = False
+        return pressed
+
+    def clear(self):
+        """Forget presses that haven't been polled yet (e.g. leaving a menu)"""
+        self.update()
+        self._pending = 0
+        self._released = 0
+        self._chord = False
+        self.chord = False
+
+    def take_release(self, key):
+        """
+        Check for a release of key since the last take_release()/clear()
+        Returns how long it was held in ms, or -1 if it wasn't released
+        """
+        bit = 1 << key
+        if not self._released & bit:
+            return -1
+        self._released &= ~bit
+        return self.held_ms[key]
+
+    def key(self, key):
+        """Pin-style view of one key (its .value reads like the old DigitalInOut)"""
+        return KeyView(self, key)
+
+class KeyView:
+    """
+    Stands in for a button's DigitalInOut: .value is the pin level the
+    old code expected (high when pressed for game buttons, low for the
+    encoder button), taken from the event state
+    """
+
+    def __init__(self, controls, key):
+        self.controls = controls
+        self.key = key
+        self._bit = 1 << key
+        self._level_when_pressed = key != KEY_ENCODER
+
+    @property
+    def value(self):
+        self.controls.update()
+        pressed = bool(self.controls.down & self._bit)
+        return pressed == self._level_when_pressed
@@ -0,0 +1,260 @@
+# entity_store.py
+# Structure-of-arrays entity backend
+# Obstacle and bullet data live in parallel arrays instead of one object each,
+# and update/culling/collision run as batched passes over the columns
+
+import array
+from blit import fill_rect
+from graphics import PLAYER_Y
+from lanes import make_lanes
+
+try:
+    from ulab import numpy as np
+except ImportError:
+    np = None  # Plain array.array columns
+
+OBSTACLE_WIDTH, OBSTACLE_HEIGHT = 16, 6
+OBSTACLE_START_Y = 10
+OBSTACLE_HEALTH = 3
+BULLET_SPEED = 4
+
+# Obstacle y is fixed-point, in tenths of a pixel
+# Speeds are whole numbers plus 0.2 steps, so every position is exact
+# (float32 columns drifted and culled/collided a frame off the object backend)
+Y_SCALE = 10
+
+def _int_column(size):
+    """16-bit integer column (ulab array if available so moves run in C)"""
+    if np:
+        return np.zeros(size, dtype=np.int16)
+    return array.array("h", [0] * size)
+
+class ArrayEntities:
+    """
+    Obstacles and bullets stored as columns (lane, x, y, health)
+    Obstacle y is in tenths of a pixel (Y_SCALE), bullet y in pixels
+    Active entries are packed at the front (0 .. count-1), removal swaps
+    the last entry into the hole, so every pass is a tight loop over arrays
+    Same interface as game_objects.PooledEntities
+    """
+
+    def __init__(self, lane_positions, max_obstacles=8, max_bullets=12):
+        """
+        lane_positions: list of x-coordinates for each lane
+        max_obstacles, max_bullets: column sizes (new spawns are dropped when full)
+        """
+        self.lane_positions = lane_positions
+        self.max_obstacles = max_obstacles
+        self.max_bullets = max_bullets
+
+        # Obstacle columns
+        # (lane and health are bytes whatever the pool size: lane < lane
+        # count, health <= OBSTACLE_HEALTH; slot numbers go in the lane queues)
+        self.obs_lane = bytearray(max_obstacles)
+        self.obs_x = array.array("h", [0] * max_obstacles)
+        self.obs_y = _int_column(max_obstacles)
+        self.obs_health = bytearray(max_obstacles)
+        self.obstacle_count = 0
+
+        # Obstacle slot numbers of each lane, lowest first (collision broad-phase)
+        self.lanes = make_lanes(len(lane_positions), max_obstacles, slots=True)
+
+        # Bullet columns
+        self.bullet_lane = bytearray(max_bullets)
+        self.bullet_x = array.array("h", [0] * max_bullets)
+        self.bullet_y = _int_column(max_bullets)
+        self.bullet_spent = bytearray(max_bullets)  # 1 = hit something this frame
+        self.bullet_count = 0
+
+        # Bullet slot numbers of each lane, oldest first (collisions go in
+        # spawn order, which swap-removal scrambles in the columns)
+        self.bullet_lanes = make_lanes(len(lane_positions), max_bullets, slots=True)
+
+        self.dropped = 0  # Spawns lost because the columns were full
+
+    def clear(self):
+        """Remove everything (start of a new game)"""
+        self.obstacle_count = 0
+        self.bullet_count = 0
+        for lane in self.lanes:
+            lane.clear()
+        for lane in self.bullet_lanes:
+            lane.clear()
+
+    def spawn_obstacle(self, lane):
+        """Start a new obstacle at the top of lane (False if full)"""
+        i = self.obstacle_count
+        if i >= self.max_obstacles:
+            self.dropped += 1
+            return False
+        self.obs_lane[i] = lane
+        self.obs_x[i] = self.lane_positions[lane]
+        self.obs_y[i] = OBSTACLE_START_Y * Y_SCALE
+        self.obs_health[i] = OBSTACLE_HEALTH
+        self.obstacle_count = i + 1
+        self.lanes[lane].push(i)
+        return True
+
+    def fire(self, lane, y=56):
+        """Fire a bullet from lane (False if full)"""
+        i = self.bullet_count
+        if i >= self.max_bullets:
+            self.dropped += 1
+            return False
+        self.bullet_lane[i] = lane
+        self.bullet_x[i] = self.lane_positions[lane]
+        self.bullet_y[i] = y
+        self.bullet_spent[i] = 0
+        self.bullet_count = i + 1
+        self.bullet_lanes[lane].push(i)
+        return True
+
+    def _remove_obstacle(self, i):
+        """Swap the last obstacle into slot i"""
+        last = self.obstacle_count - 1
+        self.lanes[self.obs_lane[i]].remove(i)
+        if i != last:
+            self.lanes[self.obs_lane[last]].replace(last, i)
+            self.obs_lane[i] = self.obs_lane[last]
+            self.obs_x[i] = self.obs_x[last]
+            self.obs_y[i] = self.obs_y[last]
+            self.obs_health[i] = self.obs_health[last]
+        self.obstacle_count = last
+
+    def _remove_bullet(self, i):
+        """Swap the last bullet into slot i"""
+        last = self.bullet_count - 1
+        self.bullet_lanes[self.bullet_lane[i]].remove(i)
+        if i != last:
+            self.bullet_lanes[self.bullet_lane[last]].replace(last, i)
+            self.bullet_lane[i] = self.bullet_lane[last]
+            self.bullet_x[i] = self.bullet_x[last]
+            self.bullet_y[i] = self.bullet_y[last]
+            self.bullet_spent[i] = self.bullet_spent[last]
+        self.bullet_count = last
+
+    def update(self, speed):
+        """
+        Move everything and drop what left the screen
+        Returns how many obstacles passed the bottom (dodged)
+        """
+        # Batched move
+        bullet_y = self.bullet_y
+        obs_y = self.obs_y
+        step = int(speed * Y_SCALE + 0.5)  # Rounds off the float error in speed
+        if np:
+            # Whole column in one C call (unused slots move too and may wrap
+            # around, spawn resets them before they're read)
+            bullet_y -= BULLET_SPEED
+            obs_y += step
+        else:
+            for i in range(self.bullet_count):
+                bullet_y[i] -= BULLET_SPEED
+            for i in range(self.obstacle_count):
+                obs_y[i] += step
+
+        # Cull bullets that are off the top or hit something last frame
+        # (backwards so swap-removal is safe)
+        bullet_spent = self.bullet_spent
+        for i in range(self.bullet_count - 1, -1, -1):
+            if bullet_y[i] < 0 or bullet_spent[i]:
+                self._remove_bullet(i)
+
+        # Cull obstacles off the bottom (each one was dodged) or destroyed
+        dodged = 0
+        obs_health = self.obs_health
+        bottom_edge = 64 * Y_SCALE
+        for i in range(self.obstacle_count - 1, -1, -1):
+            if obs_y[i] > bottom_edge:
+                self._remove_obstacle(i)
+                dodged += 1
+            elif not obs_health[i]:
+                self._remove_obstacle(i)
+        return dodged
+
+    def collide(self):
+        """
+        Bullet-obstacle collisions (same distance check as the object backend)
+        Returns how many obstacles were destroyed
+        Each bullet only looks at the obstacles in its own lane that are
+        within 8 pixels of it (lanes are further apart than that)
+        Bullets and obstacles are both visited oldest first, like the
+        original loop over every pair
+        Spent bullets and destroyed obstacles stay in their slots until the
+        next update(), like the object backend, so both fill up the same way
+        """
+        destroyed = 0
+        obs_y, obs_health = self.obs_y, self.obs_health
+        bullet_y, bullet_spent = self.bullet_y, self.bullet_spent
+
+        for lane_index in range(len(self.lanes)):
+            lane = self.lanes[lane_index]
+            queue, count = lane.items, lane.count
+            bullet_lane = self.bullet_lanes[lane_index]
+            bullet_queue = bullet_lane.items
+            for k in range(bullet_lane.count):
+                i = bullet_queue[k]
+                if bullet_spent[i]:
+                    continue
+
+                # Binary search for the lowest obstacle above by + 8
+                # (queue is ordered lowest first, i.e. y decreasing)
+                by = bullet_y[i]
+                top = (by + 8) * Y_SCALE
+                lo, hi = 0, count
+                while lo < hi:
+                    mid = (lo + hi) // 2
+                    if obs_y[queue[mid]] >= top:
+                        lo = mid + 1
+                    else:
+                        hi = mid
+
+                # First live obstacle within reach is the oldest one
+                bottom = (by - 8) * Y_SCALE
+                while lo < count:
+                    j = queue[lo]
+                    if obs_y[j] <= bottom:
+                        break
+                    if obs_health[j]:
+                        obs_health[j] -= 1
+                        if obs_health[j] == 0:
+                            destroyed += 1
+                        bullet_spent[i] = 1  # Mark bullet as used up
+                        break
+                    lo += 1
+        return destroyed
+
+    def hits_player(self, lane_index):
+        """
+        True if an obstacle touches the player ship
+        Only the lowest live obstacle in the player's lane can be touching it
+        """
+        lane = self.lanes[lane_index]
+        queue = lane.items
+        obs_y, obs_health = self.obs_y, self.obs_health
+        near, far = (PLAYER_Y + 10) * Y_SCALE, (PLAYER_Y - 10) * Y_SCALE
+        for i in range(lane.count):
+            j = queue[i]
+            if obs_health[j] and obs_y[j] < near:
+                return obs_y[j] > far
+        return False
+
+    def draw(self, bitmap):
+        """Draw all entities into bitmap"""
+        half = OBSTACLE_WIDTH // 2
+        for i in range(self.obstacle_count):
+            if self.obs_health[i]:
+                fill_rect(bitmap, self.obs_x[i] - half, self.obs_y[i] // Y_SCALE,
+                          OBSTACLE_WIDTH, OBSTACLE_HEIGHT)
+        for i in range(self.bullet_count):
+            fill_rect(bitmap, self.bullet_x[i] - 1, self.bullet_y[i] - 1, 3, 3)
+
+    def draw_tracked(self, renderer):
+        """Draw all entities through a DirtyRectRenderer"""
+        half = OBSTACLE_WIDTH // 2
+        for i in range(self.obstacle_count):
+            if self.obs_health[i]:
+                renderer.fill_rect(self.obs_x[i] - half, self.obs_y[i] // Y_SCALE,
+                                   OBSTACLE_WIDTH, OBSTACLE_HEIGHT)
+        for i in range(self.bullet_count):
+            renderer.fill_rect(self.bullet_x[i] - 1, self.bullet_y[i] - 1, 3, 3)
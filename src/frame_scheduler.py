@@ -0,0 +1,83 @@
+# frame_scheduler.py
+# Deadline-based frame pacing for the game loop
+# Sleeps only what's left of each frame and refreshes the display in step with the game
+
+import time
+
+class FrameScheduler:
+    """
+    Keeps the game loop at a fixed frame period
+    Turns off displayio auto_refresh while running so the screen is
+    refreshed once per game update instead of whenever displayio decides
+    """
+
+    def __init__(self, display, fps=50):
+        """
+        display: displayio display to refresh
+        fps: target frames per second
+        """
+        self.display = display
+        self.fps = fps
+        self.period_ns = 1000000000 // fps
+        
+        # Stats
+        self.frames = 0
+        self.overruns = 0      # Frames that took longer than the period
+        self.worst_ns = 0      # Longest frame (work only, no sleep)
+        self._deadline = 0
+        self._start_ns = 0
+
+    def start(self):
+        """Call right before the game loop starts"""
+        self.display.auto_refresh = False
+        self.frames = 0
+        self.overruns = 0
+        self.worst_ns = 0
+        self._start_ns = time.monotonic_ns()
+        self._deadline = self._start_ns + self.period_ns
+
+    def stop(self):
+        """Call when leaving the game loop (menus rely on auto refresh)"""
+        self.display.auto_refresh = True
+
+    def end_frame(self):
+        """
+        Call at the end of every frame
+        Sleeps until the frame deadline, then pushes the frame to the display
+        """
+        self.wait()
+        self.refresh()
+
+    def wait(self):
+        """Sleep whatever is left of this frame's period"""
+        now = time.monotonic_ns()
+        remaining = self._deadline - now
+        
+        # Track how long the frame's work took
+        used = self.period_ns - remaining
+        if used > self.worst_ns:
+            self.worst_ns = used
+        
+        if remaining > 0:
+            time.sleep(remaining / 1000000000)
+            self._deadline += self.period_ns
+        else:
+            # Overran - start the next frame from now instead of trying to catch up
+            self.overruns += 1
+            self._deadline = now + self.period_ns
+
+    def refresh(self):
+        """Push the frame to the display"""
+        # wait() already did the pacing, so no target_frames_per_second here
+        # (displayio would pace again and skip frames that ran a bit late)
+        self.display.refresh()
+        self.frames += 1
+
+    def report(self):
+        """Print frame rate stats on the serial console"""
+        if not self.frames:
+            return
+        elapsed = (time.monotonic_ns() - self._start_ns) / 1000000000
+        print(f"Frames: {self.frames}, avg {self.frames / elapsed:.1f} FPS "
+              f"(target {self.fps}), overruns: {self.overruns}, "
+              f"worst frame: {self.worst_ns / 1000000:.1f} ms")
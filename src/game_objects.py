@@ -1,8 +1,11 @@
 # game_objects.py
 # Game entities: Obstacles and Bullets
 # These are the things that move on screen during gameplay
+# EntityPool keeps a fixed set of them and recycles instances between spawns
 
-import random
+from blit import fill_rect
+from graphics import PLAYER_Y
+from lanes import make_lanes
 
 class Obstacle:
     """
@@ -10,19 +13,54 @@ class Obstacle:
     Player must dodge or shoot these
     """
     
-    def __init__(self, lane, lane_positions):
+    __slots__ = ("lane", "x", "y", "width", "height", "health", "active",
+                 "sprite", "pool_index", "serial")
+    
+    def __init__(self, lane=None, lane_positions=None):
         """
         Create obstacle in a random lane
-        lane: which lane (0, 1, or 2)
+        lane: which lane (0, 1, or 2), None for an inactive pool slot
         lane_positions: list of x-coordinates for each lane
         """
+        self.width = 16
+        self.height = 6
+        self.sprite = None  # TileGrid when using sprite render mode
+        self.pool_index = -1  # Position in EntityPool.items (-1 = not in a pool)
+        self.serial = 0  # Spawn order, used to find the oldest in a pool
+        
+        if lane is None:
+            self.lane = 0
+            self.x = self.y = 0
+            self.health = 0
+            self.active = False
+        else:
+            self.spawn(lane, lane_positions)
+    
+    def spawn(self, lane, lane_positions):
+        """(Re)start this obstacle at the top of a lane"""
         self.lane = lane
         self.x = lane_positions[lane]
         self.y = 10  # Start at top of screen
-        self.width = 16
-        self.height = 6
         self.health = 3  # Takes 3 hits to destroy
         self.active = True
+    
+    def attach_sprite(self, sprite):
+        """
+        Show this obstacle with a TileGrid instead of drawing into the bitmap
+        sprite: TileGrid from SpriteLayer
+        """
+        self.sprite = sprite
+        sprite.hidden = False
+        self._move_sprite()
+    
+    def _move_sprite(self):
+        """Move the TileGrid to match position (hide it once inactive)"""
+        if self.active:
+            self.sprite.x = int(self.x - self.width // 2)
+            self.sprite.y = int(self.y)
+        else:
+            self.sprite.hidden = True
+            self.sprite = None
         
     def update(self, speed):
         """
@@ -30,22 +68,30 @@ class Obstacle:
         Returns True if obstacle passed bottom (player dodged it)
         """
         self.y += speed
+        passed = False
         if self.y > 64:  # Off bottom of screen
             self.active = False
-            return True  # Player successfully dodged
-        return False
+            passed = True  # Player successfully dodged
+        if self.sprite:
+            self._move_sprite()
+        return passed
         
     def draw(self, bitmap):
-        """Draw obstacle as filled rectangle"""
+        """Draw obstacle as filled rectangle (clipped to the screen)"""
         if self.health > 0:
             start_x = int(self.x - self.width // 2)
-            for row in range(self.height):
-                for col in range(self.width):
-                    px = start_x + col
-                    py = int(self.y) + row
-                    # Make sure we're drawing within screen bounds
-                    if 0 <= px < 128 and 0 <= py < 64:
-                        bitmap[px, py] = 1
+            fill_rect(bitmap, start_x, int(self.y), self.width, self.height)
+    
+    def bounds(self):
+        """
+        Box covered by draw() as (x0, y0, x1, y1), x1/y1 exclusive
+        Returns None if nothing gets drawn
+        """
+        if self.health <= 0:
+            return None
+        start_x = int(self.x - self.width // 2)
+        start_y = int(self.y)
+        return (start_x, start_y, start_x + self.width, start_y + self.height)
                         
     def hit(self):
         """
@@ -55,6 +101,8 @@ class Obstacle:
         self.health -= 1
         if self.health <= 0:
             self.active = False
+            if self.sprite:
+                self._move_sprite()
             return True  # Obstacle destroyed
         return False  # Still has health left
 
@@ -65,27 +113,325 @@ class Bullet:
     Destroys obstacles on contact
     """
     
-    def __init__(self, x, y):
+    __slots__ = ("lane", "x", "y", "active", "sprite", "pool_index", "serial")
+    
+    def __init__(self, x=None, y=None):
         """
         Create bullet at player's position
-        x, y: starting coordinates
+        x, y: starting coordinates (None for an inactive pool slot)
         """
+        self.sprite = None  # TileGrid when using sprite render mode
+        self.pool_index = -1  # Position in EntityPool.items (-1 = not in a pool)
+        self.serial = 0  # Spawn order, used to find the oldest in a pool
+        self.lane = 0  # Lane it was fired from (set by PooledEntities.fire)
+        
+        if x is None:
+            self.x = self.y = 0
+            self.active = False
+        else:
+            self.spawn(x, y)
+    
+    def spawn(self, x, y):
+        """(Re)start this bullet at (x, y)"""
         self.x = x
         self.y = y
         self.active = True
+    
+    def attach_sprite(self, sprite):
+        """
+        Show this bullet with a TileGrid instead of drawing into the bitmap
+        sprite: TileGrid from SpriteLayer
+        """
+        self.sprite = sprite
+        sprite.hidden = False
+        self._move_sprite()
+    
+    def _move_sprite(self):
+        """Move the TileGrid to match position (hide it once inactive)"""
+        if self.active:
+            self.sprite.x = int(self.x) - 1
+            self.sprite.y = int(self.y) - 1
+        else:
+            self.sprite.hidden = True
+            self.sprite = None
         
     def update(self):
         """Move bullet upward"""
         self.y -= 4  # Move 4 pixels up per frame
         if self.y < 0:  # Off top of screen
             self.active = False
+        if self.sprite:
+            self._move_sprite()
+    
+    def deactivate(self):
+        """Bullet hit something - remove it"""
+        self.active = False
+        if self.sprite:
+            self._move_sprite()
             
     def draw(self, bitmap):
-        """Draw bullet as small filled square (3x3 pixels)"""
-        for dy in range(-1, 2):
-            for dx in range(-1, 2):
-                px = int(self.x) + dx
-                py = int(self.y) + dy
-                # Make sure we're drawing within screen bounds
-                if 0 <= px < 128 and 0 <= py < 64:
-                    bitmap[px, py] = 1
\ No newline at end of file
+        """Draw bullet as small filled square (3x3 pixels, clipped to the screen)"""
+        fill_rect(bitmap, int(self.x) - 1, int(self.y) - 1, 3, 3)
+    
+    def bounds(self):
+        """Box covered by draw() as (x0, y0, x1, y1), x1/y1 exclusive"""
+        x, y = int(self.x), int(self.y)
+        return (x - 1, y - 1, x + 2, y + 2)
+
+
+# What EntityPool.acquire() does when every slot is in use
+OVERFLOW_DROP = "drop"        # Return None (the new entity just doesn't appear)
+OVERFLOW_RECYCLE = "recycle"  # Reuse the oldest active entity
+
+class EntityPool:
+    """
+    Fixed number of preallocated entities (Obstacle or Bullet)
+    Active ones are packed at the front of items[0:count], so loops use:
+        for i in range(pool.count): entity = pool.items[i]
+    release() swaps the last active entity into the freed spot, so it's O(1)
+    Nothing is allocated after the pool is built
+    """
+
+    def __init__(self, factory, capacity, overflow=OVERFLOW_DROP):
+        """
+        factory: class to fill the pool with (called with no arguments)
+        capacity: maximum number of active entities
+        overflow: OVERFLOW_DROP or OVERFLOW_RECYCLE
+        """
+        self.capacity = capacity
+        self.overflow = overflow
+        self.items = [factory() for _ in range(capacity)]
+        for index, entity in enumerate(self.items):
+            entity.pool_index = index
+        self.count = 0
+        self.dropped = 0  # Spawns lost to overflow (for tuning capacity)
+        self._serial = 0
+
+    def acquire(self):
+        """
+        Get an inactive entity to spawn (call its spawn() next)
+        Returns None if the pool is full and overflow is OVERFLOW_DROP
+        """
+        if self.count >= self.capacity:
+            self.dropped += 1
+            if self.overflow != OVERFLOW_RECYCLE:
+                return None
+            # Recycle the oldest active entity
+            oldest = self.items[0]
+            for i in range(1, self.count):
+                if self.items[i].serial < oldest.serial:
+                    oldest = self.items[i]
+            self.release(oldest)
+        
+        entity = self.items[self.count]
+        self.count += 1
+        self._serial += 1
+        entity.serial = self._serial
+        return entity
+
+    def release(self, entity):
+        """Return an entity to the pool (O(1) swap with the last active one)"""
+        index = entity.pool_index
+        last_index = self.count - 1
+        if index > last_index:
+            return  # Already released
+        
+        last = self.items[last_index]
+        self.items[index] = last
+        last.pool_index = index
+        self.items[last_index] = entity
+        entity.pool_index = last_index
+        self.count = last_index
+        
+        entity.active = False
+        if entity.sprite:
+            entity.sprite.hidden = True
+            entity.sprite = None
+
+    def clear(self):
+        """Release everything (start of a new game)"""
+        while self.count:
+            self.release(self.items[self.count - 1])
+
+
+class PooledEntities:
+    """
+    All obstacles and bullets for a game, stored as pooled objects
+    Same interface as entity_store.ArrayEntities so code.py can use either:
+    spawn_obstacle(), fire(), update(), collide(), hits_player(), draw()
+    """
+
+    def __init__(self, lane_positions, max_obstacles=8, max_bullets=12,
+                 overflow=OVERFLOW_DROP, sprites=None):
+        """
+        lane_positions: list of x-coordinates for each lane
+        max_obstacles, max_bullets: pool sizes
+        overflow: what to do when a pool is full (OVERFLOW_DROP/OVERFLOW_RECYCLE)
+        sprites: SpriteLayer for sprite render mode, or None
+        """
+        self.lane_positions = lane_positions
+        self.obstacles = EntityPool(Obstacle, max_obstacles, overflow)
+        self.bullets = EntityPool(Bullet, max_bullets, overflow)
+        self.sprites = sprites
+        
+        # Obstacles of each lane, lowest first (collision broad-phase)
+        self.lanes = make_lanes(len(lane_positions), max_obstacles)
+        # Bullets of each lane, oldest first (collisions use spawn order,
+        # which release() scrambles in the pool)
+        self.bullet_lanes = make_lanes(len(lane_positions), max_bullets)
+
+    @property
+    def obstacle_count(self):
+        return self.obstacles.count
+
+    @property
+    def bullet_count(self):
+        return self.bullets.count
+
+    def clear(self):
+        """Remove everything (start of a new game)"""
+        self.obstacles.clear()
+        self.bullets.clear()
+        for lane in self.lanes:
+            lane.clear()
+        for lane in self.bullet_lanes:
+            lane.clear()
+
+    def spawn_obstacle(self, lane):
+        """Start a new obstacle at the top of lane (False if the pool is full)"""
+        obs = self.obstacles.acquire()
+        if not obs:
+            return False
+        self.lanes[obs.lane].remove(obs)  # Only there if it was recycled
+        sprite = None
+        if self.sprites:
+            sprite = self.sprites.acquire_obstacle()
+            if sprite is None:
+                # No free TileGrid: drop it rather than spawn an invisible obstacle
+                self.obstacles.release(obs)
+                self.obstacles.dropped += 1
+                return False
+        obs.spawn(lane, self.lane_positions)
+        self.lanes[lane].push(obs)
+        if sprite is not None:
+            obs.attach_sprite(sprite)
+        return True
+
+    def fire(self, lane, y=56):
+        """Fire a bullet from lane (False if the pool is full)"""
+        bullet = self.bullets.acquire()
+        if not bullet:
+            return False
+        self.bullet_lanes[bullet.lane].remove(bullet)  # Only there if it was recycled
+        sprite = None
+        if self.sprites:
+            sprite = self.sprites.acquire_bullet()
+            if sprite is None:
+                # No free TileGrid: drop it rather than fire an invisible bullet
+                self.bullets.release(bullet)
+                self.bullets.dropped += 1
+                return False
+        bullet.spawn(self.lane_positions[lane], y)
+        bullet.lane = lane
+        self.bullet_lanes[lane].push(bullet)
+        if sprite is not None:
+            bullet.attach_sprite(sprite)
+        return True
+
+    def update(self, speed):
+        """
+        Move everything and drop what left the screen
+        Returns how many obstacles passed the bottom (dodged)
+        """
+        # Walk backwards so release() (swap with last) is safe mid-loop
+        bullets = self.bullets
+        for i in range(bullets.count - 1, -1, -1):
+            bullet = bullets.items[i]
+            bullet.update()
+            if not bullet.active:
+                bullets.release(bullet)
+                self.bullet_lanes[bullet.lane].remove(bullet)
+        
+        dodged = 0
+        obstacles = self.obstacles
+        for i in range(obstacles.count - 1, -1, -1):
+            obs = obstacles.items[i]
+            if obs.update(speed):
+                dodged += 1
+            if not obs.active:
+                obstacles.release(obs)
+                self.lanes[obs.lane].remove(obs)
+        return dodged
+
+    def collide(self):
+        """
+        Bullet-obstacle collisions
+        Returns how many obstacles were destroyed
+        Each bullet only looks at the obstacles in its own lane that are
+        within 8 pixels of it (lanes are further apart than that, so other
+        lanes could never pass the distance check anyway)
+        Bullets and obstacles are both visited oldest first, the same order
+        as the original loop over every pair, so the same bullet gets used up
+        """
+        destroyed = 0
+        for lane_index in range(len(self.lanes)):
+            lane = self.lanes[lane_index]
+            queue, count = lane.items, lane.count
+            bullet_lane = self.bullet_lanes[lane_index]
+            bullet_queue = bullet_lane.items
+            for i in range(bullet_lane.count):
+                bullet = bullet_queue[i]
+                if not bullet.active:
+                    continue
+                
+                # Binary search for the lowest obstacle above bullet.y + 8
+                # (queue is ordered lowest first, i.e. y decreasing)
+                top = bullet.y + 8
+                lo, hi = 0, count
+                while lo < hi:
+                    mid = (lo + hi) // 2
+                    if queue[mid].y >= top:
+                        lo = mid + 1
+                    else:
+                        hi = mid
+                
+                # First live obstacle within reach is the oldest one
+                bottom = bullet.y - 8
+                while lo < count:
+                    obs = queue[lo]
+                    if obs.y <= bottom:
+                        break
+                    if obs.active:
+                        bullet.deactivate()
+                        if obs.hit():
+                            destroyed += 1
+                        break
+                    lo += 1
+        return destroyed
+
+    def hits_player(self, lane_index):
+        """
+        True if an obstacle touches the player ship
+        Only the lowest live obstacle in the player's lane can be touching it
+        """
+        lane = self.lanes[lane_index]
+        queue = lane.items
+        for i in range(lane.count):
+            obs = queue[i]
+            if obs.active and obs.health > 0 and obs.y < PLAYER_Y + 10:
+                return obs.y > PLAYER_Y - 10
+        return False
+
+    def draw(self, bitmap):
+        """Draw all entities into bitmap"""
+        for i in range(self.obstacles.count):
+            self.obstacles.items[i].draw(bitmap)
+        for i in range(self.bullets.count):
+            self.bullets.items[i].draw(bitmap)
+
+    def draw_tracked(self, renderer):
+        """Draw all entities through a DirtyRectRenderer"""
+        for i in range(self.obstacles.count):
+            renderer.draw(self.obstacles.items[i])
+        for i in range(self.bullets.count):
+            renderer.draw(self.bullets.items[i])
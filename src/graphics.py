@@ -1,6 +1,15 @@
 # graphics.py
 # All the drawing functions for game graphics
-# Includes: background grid, HUD, player ship, targeting reticle, folder icons
+# Includes: background grid, HUD, player ship, targeting reticle, folder icons,
+# startup radar
+
+import math
+from blit import fill_rect, hline, vline
+
+# Player ship size and row (nose is at lane x, PLAYER_Y)
+PLAYER_Y = 56
+PLAYER_HALF_WIDTH = 6
+PLAYER_HEIGHT = 8
 
 def draw_grid(bitmap, offset):
     """
@@ -27,8 +36,7 @@ def draw_grid(bitmap, offset):
         if y < 64:
             # Width increases as we go down (perspective)
             width = int((64 - y) * 1.5)
-            for x in range(max(0, 64 - width), min(128, 64 + width)):
-                bitmap[x, y] = 1
+            hline(bitmap, 64 - width, y, 2 * width)
 
 def draw_hud(bitmap):
     """
@@ -37,23 +45,21 @@ def draw_hud(bitmap):
     """
     bracket_size = 10
     
-    # Draw all four corner brackets
-    for i in range(bracket_size):
-        # Top-left corner
-        bitmap[2, 2 + i] = 1
-        bitmap[2 + i, 2] = 1
-        
-        # Top-right corner
-        bitmap[126, 2 + i] = 1
-        bitmap[126 - i, 2] = 1
-        
-        # Bottom-left corner
-        bitmap[2, 62 - i] = 1
-        bitmap[2 + i, 62] = 1
-        
-        # Bottom-right corner
-        bitmap[126, 62 - i] = 1
-        bitmap[126 - i, 62] = 1
+    # Top-left corner
+    vline(bitmap, 2, 2, bracket_size)
+    hline(bitmap, 2, 2, bracket_size)
+    
+    # Top-right corner
+    vline(bitmap, 126, 2, bracket_size)
+    hline(bitmap, 127 - bracket_size, 2, bracket_size)
+    
+    # Bottom-left corner
+    vline(bitmap, 2, 63 - bracket_size, bracket_size)
+    hline(bitmap, 2, 62, bracket_size)
+    
+    # Bottom-right corner
+    vline(bitmap, 126, 63 - bracket_size, bracket_size)
+    hline(bitmap, 127 - bracket_size, 62, bracket_size)
 
 def draw_targeting_reticle(bitmap):
     """
@@ -61,19 +67,16 @@ def draw_targeting_reticle(bitmap):
     """
     center_x, center_y = 64, 28
     
+    arm, gap = 12, 4  # Line length and empty gap in the middle
+    length = arm - gap + 1
+    
     # Horizontal crosshair lines (with gap in middle)
-    for i in range(12, 3, -1):
-        if 0 <= center_x - i < 128:
-            bitmap[center_x - i, center_y] = 1
-        if 0 <= center_x + i < 128:
-            bitmap[center_x + i, center_y] = 1
+    hline(bitmap, center_x - arm, center_y, length)
+    hline(bitmap, center_x + gap, center_y, length)
     
     # Vertical crosshair lines (with gap in middle)
-    for i in range(12, 3, -1):
-        if 0 <= center_y - i < 64:
-            bitmap[center_x, center_y - i] = 1
-        if 0 <= center_y + i < 64:
-            bitmap[center_x, center_y + i] = 1
+    vline(bitmap, center_x, center_y - arm, length)
+    vline(bitmap, center_x, center_y + gap, length)
 
 def draw_player(bitmap, lane_index, lane_positions):
     """
@@ -82,21 +85,29 @@ def draw_player(bitmap, lane_index, lane_positions):
     lane_positions: list of x-coordinates for lanes
     """
     x = lane_positions[lane_index]
-    y = 56  # Player is near bottom of screen
-    
-    # Draw triangle ship (gets wider as it goes down)
+    y = PLAYER_Y  # Player is near bottom of screen
+    draw_player_at(bitmap, x, y)
+
+def draw_player_at(bitmap, x, y):
+    """
+    Draw player spaceship with its nose at (x, y)
+    Also used to pre-draw the ship sprite
+    """
+    # Draw triangle ship (gets wider as it goes down), one span per row
     for row in range(7):
-        width = row
-        for col in range(-width, width + 1):
-            draw_x, draw_y = x + col, y + row
-            if 0 <= draw_x < 128 and 0 <= draw_y < 64:
-                bitmap[draw_x, draw_y] = 1
+        hline(bitmap, x - row, y + row, 2 * row + 1)
     
     # Draw engine exhaust ports
-    if 0 <= x - 2 < 128 and y + 7 < 64:
-        bitmap[x - 2, y + 7] = 1
-    if 0 <= x + 2 < 128 and y + 7 < 64:
-        bitmap[x + 2, y + 7] = 1
+    fill_rect(bitmap, x - 2, y + 7, 1, 1)
+    fill_rect(bitmap, x + 2, y + 7, 1, 1)
+
+def player_bounds(lane_index, lane_positions):
+    """
+    Box covered by draw_player() as (x0, y0, x1, y1), x1/y1 exclusive
+    """
+    x = lane_positions[lane_index]
+    y = PLAYER_Y
+    return (x - PLAYER_HALF_WIDTH, y, x + PLAYER_HALF_WIDTH + 1, y + PLAYER_HEIGHT)
 
 def draw_folder(bitmap, x, y):
     """
@@ -104,13 +115,10 @@ def draw_folder(bitmap, x, y):
     x, y: top-left corner of folder
     """
     # Draw tab
-    for i in range(4):
-        bitmap[x + i, y] = 1
+    hline(bitmap, x, y, 4)
     
     # Draw main folder body
-    for row in range(5):
-        for col in range(6):
-            bitmap[x + col, y + 1 + row] = 1
+    fill_rect(bitmap, x, y + 1, 6, 5)
 
 def draw_spaceship(bitmap, x, y):
     """
@@ -143,15 +151,93 @@ def draw_stars(bitmap):
     for star_x, star_y in stars:
         bitmap[star_x, star_y] = 1
 
-def check_collision(player_lane, lane_positions, obstacles):
+def draw_radar_frame(bitmap, frame, num_frames=60):
+    """
+    Draw one frame of the cockpit HUD radar (no text)
+    Corner brackets, radar circle, scan line at frame/num_frames of a turn
+    and the blips the scan line is passing
+    Works on any bitmap with [x, y] access (also used by hud_frames.py on a PC)
+    """
+    # Draw corner targeting brackets
+    bracket_size = 8
+    # Top-left corner
+    for i in range(bracket_size):
+        bitmap[2+i, 2] = 1
+        bitmap[2, 2+i] = 1
+    # Top-right corner
+    for i in range(bracket_size):
+        bitmap[126-i, 2] = 1
+        bitmap[126, 2+i] = 1
+    # Bottom-left corner
+    for i in range(bracket_size):
+        bitmap[2+i, 62] = 1
+        bitmap[2, 62-i] = 1
+    # Bottom-right corner
+    for i in range(bracket_size):
+        bitmap[126-i, 62] = 1
+        bitmap[126, 62-i] = 1
+    
+    # Draw radar circle in center
+    radar_x, radar_y = 64, 28
+    radar_radius = 18
+    
+    # Draw circle outline using polar coordinates
+    for angle in range(0, 360, 10):
+        rad = math.radians(angle)
+        x = int(radar_x + radar_radius * math.cos(rad))
+        y = int(radar_y + radar_radius * math.sin(rad))
+        if 0 <= x < 128 and 0 <= y < 64:
+            bitmap[x, y] = 1
+    
+    # Draw center dot
+    for dx in range(-1, 2):
+        for dy in range(-1, 2):
+            if abs(dx) + abs(dy) <= 1:  # Plus shape
+                bitmap[radar_x + dx, radar_y + dy] = 1
+    
+    # Draw rotating scan line
+    scan_angle = (frame / num_frames) * 360
+    rad = math.radians(scan_angle)
+    for r in range(radar_radius):
+        x = int(radar_x + r * math.cos(rad))
+        y = int(radar_y + r * math.sin(rad))
+        if 0 <= x < 128 and 0 <= y < 64:
+            bitmap[x, y] = 1
+    
+    # Add radar blips that appear near scan line
+    blip_angles = [30, 120, 200, 310]  # Fixed blip positions
+    blip_distances = [12, 15, 10, 14]
+    
+    for ba, bd in zip(blip_angles, blip_distances):
+        # Calculate angle difference
+        diff = abs(scan_angle - ba)
+        if diff > 180:
+            diff = 360 - diff
+        
+        # Only show blip if scan line is nearby
+        if diff < 40:
+            rad = math.radians(ba)
+            bx = int(radar_x + bd * math.cos(rad))
+            by = int(radar_y + bd * math.sin(rad))
+            if 0 <= bx < 128 and 0 <= by < 64:
+                # Draw blip as small cross
+                bitmap[bx, by] = 1
+                if bx-1 >= 0: bitmap[bx-1, by] = 1
+                if bx+1 < 128: bitmap[bx+1, by] = 1
+
+def check_collision(player_lane, lane_positions, obstacles, count=None):
     """
     Check if player collided with any obstacles
+    obstacles: list of obstacles, or EntityPool.items with count active
     Returns True if collision detected
     """
     player_x = lane_positions[player_lane]
-    player_y = 56
+    player_y = PLAYER_Y
+    if count is None:
+        count = len(obstacles)
     
-    for obs in obstacles:
+    for i in range(count):
+        obs = obstacles[i]
         if obs.active and obs.health > 0:
             # Simple distance check
             if abs(player_x - obs.x) < 12 and abs(player_y - obs.y) < 10:
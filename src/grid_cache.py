@@ -0,0 +1,123 @@
+# grid_cache.py
+# Precomputed frames for the scrolling perspective grid
+# draw_grid() only has a handful of distinct outputs, so build them once at startup
+
+import displayio
+from graphics import draw_grid
+from blit import hline, blit_region
+
+try:
+    import bitmaptools
+except ImportError:
+    bitmaptools = None  # Falls back to coordinate tables
+
+GRID_TOP = 20  # First row the grid touches
+GRID_ROWS = 64 - GRID_TOP
+FRAME_BYTES = 128 * 64 // 8  # One cached 1-bit 128x64 bitmap
+OFF_SCREEN = 255  # Marker in coordinate tables
+
+def grid_phase(offset):
+    """
+    The part of the offset draw_grid() actually uses
+    Returns (vertical phase, horizontal phase)
+    """
+    return (offset % 20, (offset // 2) % 10)
+
+class GridCache:
+    """
+    Cache of grid frames, picked by memory budget:
+    - "frames": whole pre-drawn bitmaps, drawn with one blit
+    - "columns": x position per row for every vertical line (no float math)
+    - "none": budget too small, just call draw_grid()
+    """
+
+    def __init__(self, step=4, max_bytes=6144, bitmap_type=None):
+        """
+        step: how much the offset grows each frame (code.py uses frame * 4)
+        max_bytes: memory budget for the cache
+        bitmap_type: class for cached frames if not displayio.Bitmap
+                     (ssd1306_raw.PageBitmap in raw display mode)
+        """
+        self.frames = {}   # phase -> Bitmap
+        self.columns = {}  # line start x -> bytes of x per grid row
+        self.mode = "none"
+        
+        # Find every distinct phase the game will hit
+        phases = []
+        offset = 0
+        while True:
+            phase = grid_phase(offset)
+            if any(p == phase for p, _ in phases):
+                break
+            phases.append((phase, offset))
+            offset += step
+        
+        if (bitmaptools or bitmap_type) and len(phases) * FRAME_BYTES <= max_bytes:
+            # Whole frames fit in the budget
+            for phase, offset in phases:
+                if bitmap_type:
+                    frame = bitmap_type(128, 64)
+                else:
+                    frame = displayio.Bitmap(128, 64, 2)
+                draw_grid(frame, offset)
+                self.frames[phase] = frame
+            self.mode = "frames"
+            return
+        
+        # Otherwise try per-line coordinate tables
+        line_starts = []
+        for phase, _ in phases:
+            for i in range(0, 128, 20):
+                x = i + phase[0]
+                if x < 128 and x not in line_starts:
+                    line_starts.append(x)
+        
+        if len(line_starts) * GRID_ROWS <= max_bytes:
+            for x in line_starts:
+                self.columns[x] = self._line_table(x)
+            self.mode = "columns"
+
+    def _line_table(self, x):
+        """X position of a vertical grid line for each row (same math as draw_grid)"""
+        table = bytearray(GRID_ROWS)
+        for row in range(GRID_ROWS):
+            t = row / 44.0
+            line_x = int(64 + (x - 64) * t)
+            table[row] = line_x if 0 <= line_x < 128 else OFF_SCREEN
+        return table
+
+    def draw(self, bitmap, offset):
+        """Same result as draw_grid(bitmap, offset), using the cache when possible"""
+        phase = grid_phase(offset)
+        
+        frame = self.frames.get(phase)
+        if frame is not None:
+            # Copy grid rows, skipping black so whatever is underneath stays
+            blit_region(bitmap, frame, 0, GRID_TOP, 0, GRID_TOP, 128, 64)
+            return
+        
+        if not self.columns:
+            draw_grid(bitmap, offset)
+            return
+        
+        # Vertical lines from the tables
+        for i in range(0, 128, 20):
+            x = i + phase[0]
+            if x < 128:
+                table = self.columns.get(x)
+                if table is None:
+                    # Offset the cache wasn't built for
+                    draw_grid(bitmap, offset)
+                    return
+                y = GRID_TOP
+                for line_x in table:
+                    if line_x != OFF_SCREEN:
+                        bitmap[line_x, y] = 1
+                    y += 1
+        
+        # Horizontal lines are already cheap (one span each)
+        for i in range(30, 64, 10):
+            y = i + phase[1]
+            if y < 64:
+                width = int((64 - y) * 1.5)
+                hline(bitmap, 64 - width, y, 2 * width)
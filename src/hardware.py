@@ -10,56 +10,93 @@ import adafruit_displayio_ssd1306
 import adafruit_mpu6050
 import pwmio
 import digitalio
+import neopixel_write
 from rotary_encoder import RotaryEncoder
+from controls import Controls, KEY_ENCODER
+from config import (AUDIO_BACKEND, ENCODER_HARDWARE, ACCEL_INT_PIN, DISPLAY_DRIVER,
+                    I2C_FREQUENCY)
 
 # Release any displays from previous runs (MUST be first!)
 displayio.release_displays()
 
-# Initialize I2C bus for OLED and accelerometer
-i2c = busio.I2C(board.SCL, board.SDA)
+# Initialize I2C bus for OLED and accelerometer (speed set in config.py)
+i2c = busio.I2C(board.SCL, board.SDA, frequency=I2C_FREQUENCY)
 
 # OLED Display Setup (128x64 monochrome)
 display_bus = i2cdisplaybus.I2CDisplayBus(i2c, device_address=0x3C)
 display = adafruit_displayio_ssd1306.SSD1306(display_bus, width=128, height=64)
 
+# Optional raw driver for gameplay (shares the bus, takes over the panel
+# between begin() and end())
+raw_display = None
+if DISPLAY_DRIVER == "raw":
+    from ssd1306_raw import RawSSD1306
+    raw_display = RawSSD1306(i2c, display, address=0x3C, width=128, height=64)
+
 # Accelerometer Setup (MPU-6050)
 accelerometer = adafruit_mpu6050.MPU6050(i2c, address=0x68)
 
+# Optional MPU-6050 INT line (only used by the "motion" tap mode)
+accel_int = None
+if ACCEL_INT_PIN:
+    accel_int = digitalio.DigitalInOut(getattr(board, ACCEL_INT_PIN))
+    accel_int.direction = digitalio.Direction.INPUT
+    accel_int.pull = digitalio.Pull.DOWN
+
 # Buzzer Setup (PWM output for different frequencies)
-buzzer = pwmio.PWMOut(board.D6, frequency=440, duty_cycle=0, variable_frequency=True)
+# With AUDIO_BACKEND = "samples" the pin is driven by audiopwmio instead,
+# and buzzer becomes a ToneShim so tone code keeps working
+audio_out = None
+if AUDIO_BACKEND == "samples":
+    try:
+        import audiopwmio
+        from sample_audio import ToneShim
+        audio_out = audiopwmio.PWMAudioOut(board.D6)
+    except (ImportError, ValueError, RuntimeError) as e:
+        print(f"No sample audio on this board ({e}), using tones")
+
+if audio_out:
+    buzzer = ToneShim(audio_out)
+else:
+    buzzer = pwmio.PWMOut(board.D6, frequency=440, duty_cycle=0, variable_frequency=True)
 
 # NeoPixel LED Setup (single RGB LED)
 pixel_pin = digitalio.DigitalInOut(board.D3)
 pixel_pin.direction = digitalio.Direction.OUTPUT
+_pixel_buffer = bytearray(3)  # Reused GRB buffer for every write
+_pixel_color = None           # Last color sent (skip writes when unchanged)
+LED_BRIGHTNESS = 77           # Out of 256 (about 30%)
 
 # Rotary Encoder Setup (for menu navigation)
 # D1 = CLK, D0 = DT, range 0-3 for 4 menu options
-encoder = RotaryEncoder(board.D1, board.D0, min_val=0, max_val=3)
-
-# Rotary Encoder Button (press to select)
-encoder_btn = digitalio.DigitalInOut(board.D2)
-encoder_btn.direction = digitalio.Direction.INPUT
-encoder_btn.pull = digitalio.Pull.UP
+encoder = RotaryEncoder(board.D1, board.D0, min_val=0, max_val=3,
+                        use_hardware=ENCODER_HARDWARE)
 
-# Game Control Buttons (A, C, D for lane switching and shooting)
-button_a = digitalio.DigitalInOut(board.D8)
-button_a.direction = digitalio.Direction.INPUT
-button_a.pull = digitalio.Pull.DOWN
+# Buttons are scanned and debounced in the background by keypad
+# (see controls.py): A, C, D for lane switching and shooting (D8, D7, D10,
+# pull-down) and the rotary encoder button (D2, pull-up, press to select)
+controls = Controls((board.D8, board.D7, board.D10), board.D2)
 
-button_c = digitalio.DigitalInOut(board.D7)
-button_c.direction = digitalio.Direction.INPUT
-button_c.pull = digitalio.Pull.DOWN
-
-button_d = digitalio.DigitalInOut(board.D10)
-button_d.direction = digitalio.Direction.INPUT
-button_d.pull = digitalio.Pull.DOWN
+# Pin-style view of the encoder button for the menus, which read .value
+# like a DigitalInOut (gameplay reads button events from controls.poll())
+encoder_btn = controls.key(KEY_ENCODER)
 
 def set_neopixel(r, g, b):
-    """Set NeoPixel color with brightness control"""
-    import neopixel_write
-    brightness = 0.3
-    data = bytearray([int(g*brightness), int(r*brightness), int(b*brightness)])
-    neopixel_write.neopixel_write(pixel_pin, data)
+    """
+    Set NeoPixel color with brightness control
+    Does nothing if the LED already shows this color
+    """
+    global _pixel_color
+    color = (r << 16) | (g << 8) | b
+    if color == _pixel_color:
+        return
+    _pixel_color = color
+    
+    # Integer brightness scaling into the preallocated buffer (GRB order)
+    _pixel_buffer[0] = (g * LED_BRIGHTNESS) >> 8
+    _pixel_buffer[1] = (r * LED_BRIGHTNESS) >> 8
+    _pixel_buffer[2] = (b * LED_BRIGHTNESS) >> 8
+    neopixel_write.neopixel_write(pixel_pin, _pixel_buffer)
 
 def hsv_to_rgb(h, s, v):
     """
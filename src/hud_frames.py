@@ -0,0 +1,89 @@
+# hud_frames.py
+# Pre-rendered cockpit HUD animation: packed 1-bit frames in a file
+# Run on a PC once to build the file, then copy it to the board:
+#   python hud_frames.py /media/CIRCUITPY/hud_frames.bin
+# (no displayio needed - uses the same draw_radar_frame() as the game)
+
+import struct
+
+from graphics import draw_radar_frame
+
+# File layout: header, then one frame after another
+# Each frame is 128x64 at 1 bit per pixel, rows top to bottom,
+# leftmost pixel in the top bit of each byte = 1024 bytes
+HUD_MAGIC = b"HUD1"
+HEADER_FORMAT = "<4sHHH"  # magic, width, height, frame count
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+
+FRAME_WIDTH = 128
+FRAME_HEIGHT = 64
+FRAME_COUNT = 60  # Same 60 frames as the live animation
+
+def frame_bytes(width, height):
+    """Size of one packed frame (rows padded to whole bytes)"""
+    return (width + 7) // 8 * height
+
+class PackedBitmap:
+    """
+    1-bit bitmap stored the way the frame file is laid out
+    Supports bitmap[x, y] = value so the graphics.py drawing code works on it
+    """
+
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self.stride = (width + 7) // 8
+        self.buffer = bytearray(self.stride * height)
+
+    def __setitem__(self, xy, value):
+        x, y = xy
+        index = y * self.stride + (x >> 3)
+        bit = 0x80 >> (x & 7)
+        if value:
+            self.buffer[index] |= bit
+        else:
+            self.buffer[index] &= ~bit
+
+    def __getitem__(self, xy):
+        x, y = xy
+        return (self.buffer[y * self.stride + (x >> 3)] >> (7 - (x & 7))) & 1
+
+    def fill(self, value):
+        """Set every pixel to value (0 or 1)"""
+        byte = 0xFF if value else 0x00
+        for i in range(len(self.buffer)):
+            self.buffer[i] = byte
+
+def bake(path, num_frames=FRAME_COUNT):
+    """
+    Render the radar animation once and write it to path
+    Returns the number of bytes written
+    """
+    bitmap = PackedBitmap(FRAME_WIDTH, FRAME_HEIGHT)
+    with open(path, "wb") as f:
+        written = f.write(struct.pack(HEADER_FORMAT, HUD_MAGIC, FRAME_WIDTH,
+                                      FRAME_HEIGHT, num_frames))
+        for frame in range(num_frames):
+            bitmap.fill(0)
+            draw_radar_frame(bitmap, frame, num_frames)
+            written += f.write(bitmap.buffer)
+    return written
+
+def read_header(f):
+    """
+    Read and check the header of an open frame file
+    Returns (width, height, frame count), or None if it isn't a frame file
+    """
+    header = f.read(HEADER_SIZE)
+    if len(header) != HEADER_SIZE:
+        return None
+    magic, width, height, count = struct.unpack(HEADER_FORMAT, header)
+    if magic != HUD_MAGIC:
+        return None
+    return width, height, count
+
+if __name__ == "__main__":
+    import sys
+    out_path = sys.argv[1] if len(sys.argv) > 1 else "hud_frames.bin"
+    size = bake(out_path)
+    print(f"Wrote {FRAME_COUNT} frames ({size} bytes) to {out_path}")
@@ -0,0 +1,62 @@
+# lanes.py
+# Per-lane obstacle and bullet queues for the collision broad-phase
+# Every obstacle lives in one of the three player_lanes columns, so bullets
+# and the player only need to look at obstacles in their own lane
+
+import array
+
+class LaneQueue:
+    """
+    Obstacles (or bullets) of one lane in spawn order (oldest first)
+    They all spawn at the same y and move at the same speed, so spawn order
+    is also y order: for obstacles items[0] is the lowest on screen and the
+    last is the highest (bullets move up, so the other way round)
+    The queue never needs sorting, only appending and removing
+    """
+
+    def __init__(self, capacity, items=None):
+        """
+        capacity: most items the lane can hold
+        items: preallocated storage (e.g. an array of slot numbers),
+               default is a list for object references
+        """
+        self.items = items if items is not None else [None] * capacity
+        self.count = 0
+
+    def clear(self):
+        """Forget everything (start of a new game)"""
+        self.count = 0
+
+    def push(self, item):
+        """Add a newly spawned obstacle or bullet (the newest in the lane)"""
+        self.items[self.count] = item
+        self.count += 1
+
+    def remove(self, item):
+        """Take an item out, keeping the order of the rest (no-op if missing)"""
+        items = self.items
+        for i in range(self.count):
+            if items[i] == item:
+                for k in range(i + 1, self.count):
+                    items[k - 1] = items[k]
+                self.count -= 1
+                return
+
+    def replace(self, old, new):
+        """Swap one handle for another in place (used when storage slots move)"""
+        items = self.items
+        for i in range(self.count):
+            if items[i] == old:
+                items[i] = new
+                return
+
+def make_lanes(lane_count, capacity, slots=False):
+    """
+    One LaneQueue per lane
+    slots: store slot numbers in 16-bit arrays instead of object references
+    (up to 65535 slots, so pool sizes aren't capped at 255)
+    """
+    if slots:
+        return [LaneQueue(capacity, array.array("H", [0] * capacity))
+                for _ in range(lane_count)]
+    return [LaneQueue(capacity) for _ in range(lane_count)]
@@ -0,0 +1,92 @@
+# led_effects.py
+# Time-based NeoPixel effects ticked from the game loop (no sleeps)
+# Flashes, blinking and rainbow are worked out from the clock each frame
+
+import time
+from hardware import set_neopixel, hsv_to_rgb
+
+# Rainbow lookup table: one color per 10 degrees of hue (no float math per frame)
+RAINBOW_STEP = 10
+RAINBOW = tuple(hsv_to_rgb(hue, 1.0, 1.0) for hue in range(0, 360, RAINBOW_STEP))
+RAINBOW_STEP_MS = 20  # Time per table entry (same speed as 10 degrees per frame at 50 FPS)
+
+def _now_ms():
+    """Milliseconds clock (integer, doesn't lose precision like monotonic())"""
+    return time.monotonic_ns() // 1000000
+
+class LedEffects:
+    """
+    Works out the LED color each frame from the active effects
+    Priority: blink (level-up) > rainbow (victory) > flash (buttons) > base color
+    set_neopixel() skips the write when the color didn't change, so
+    calling tick() every frame is cheap
+    """
+
+    def __init__(self, base=(255, 255, 255)):
+        """base: color shown when no effect is running"""
+        self.base = base
+        self._flash_color = None
+        self._flash_end = 0
+        self._rainbow_start = 0
+        self._rainbow_end = 0
+        self._blink = None  # (on color, off color, period ms, on ms)
+        self._blink_start = 0
+
+    def reset(self, base=(255, 255, 255)):
+        """Stop all effects and show base right away"""
+        self.base = base
+        self._flash_color = None
+        self._rainbow_end = 0
+        self._blink = None
+        set_neopixel(*base)
+
+    def flash(self, color, duration):
+        """Show color for duration seconds, then go back"""
+        self._flash_color = color
+        self._flash_end = _now_ms() + int(duration * 1000)
+
+    def rainbow(self, duration):
+        """Cycle through the rainbow for duration seconds"""
+        self._rainbow_start = _now_ms()
+        self._rainbow_end = self._rainbow_start + int(duration * 1000)
+
+    @property
+    def rainbow_active(self):
+        """True while the rainbow is running"""
+        return self._rainbow_end > 0
+
+    def blink(self, on_color, off_color, period_ms=60, on_ms=20):
+        """Blink between two colors until stop_blink()"""
+        self._blink = (on_color, off_color, period_ms, on_ms)
+        self._blink_start = _now_ms()
+
+    def stop_blink(self):
+        """End blinking"""
+        self._blink = None
+
+    def tick(self):
+        """Update the LED - call once per frame"""
+        now = _now_ms()
+        
+        if self._blink:
+            on_color, off_color, period_ms, on_ms = self._blink
+            if (now - self._blink_start) % period_ms < on_ms:
+                set_neopixel(*on_color)
+            else:
+                set_neopixel(*off_color)
+            return
+        
+        if self._rainbow_end:
+            if now < self._rainbow_end:
+                step = (now - self._rainbow_start) // RAINBOW_STEP_MS
+                set_neopixel(*RAINBOW[step % len(RAINBOW)])
+                return
+            self._rainbow_end = 0
+        
+        if self._flash_color:
+            if now < self._flash_end:
+                set_neopixel(*self._flash_color)
+                return
+            self._flash_color = None
+        
+        set_neopixel(*self.base)
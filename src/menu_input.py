@@ -0,0 +1,79 @@
+# menu_input.py
+# Shared input handling for the menu, high scores and initials screens
+# Sleeps between checks instead of spinning, since keypad and rotaryio
+# keep counting in the background while the CPU is idle
+
+import time
+
+# What wait() returns
+EVENT_TURN = 1   # Encoder moved (read encoder.value())
+EVENT_CLICK = 2  # Encoder button pressed and released
+
+PRESS_DURATION_MS = 100  # Must hold button for 100ms to register
+
+# Sleep between checks while idle (seconds)
+IDLE_POLL_MIN = 0.005  # Right after something happened
+IDLE_POLL_MAX = 0.03   # After a while with no input (still feels instant)
+FALLBACK_POLL = 0.001  # Pins decoded in Python need fast polling
+
+class MenuInput:
+    """
+    Waits for encoder turns and encoder button clicks
+    A click is a press held at least PRESS_DURATION_MS, counted on release
+    (the debounce the three menu screens used to do by themselves)
+    A press that started before the screen opened is ignored, so the click
+    that opened a screen doesn't also close it
+    """
+
+    def __init__(self, encoder, button, min_hold_ms=PRESS_DURATION_MS):
+        """
+        encoder: RotaryEncoder (None for screens that only need the button)
+        button: the encoder button's KeyView (hardware.encoder_btn)
+        min_hold_ms: shortest press that counts as a click
+        """
+        self.encoder = encoder
+        self.controls = button.controls
+        self.key = button.key
+        self.min_hold_ms = min_hold_ms
+
+        # Sleep adaptively only if nothing needs fast polling
+        if (encoder is None or encoder.hardware) and self.controls.background:
+            self.poll_min, self.poll_max = IDLE_POLL_MIN, IDLE_POLL_MAX
+        else:
+            self.poll_min = self.poll_max = FALLBACK_POLL
+        self.begin()
+
+    def begin(self):
+        """Start a new screen: forget old presses and encoder movement"""
+        self.controls.clear()
+        if self.encoder:
+            self.encoder.reset(self.encoder.value())  # Drop turns made meanwhile
+        self._armed = not self.controls.down & (1 << self.key)
+        self._delay = self.poll_min
+
+    def wait(self):
+        """
+        Sleep until the encoder turns or the button is clicked
+        Returns EVENT_TURN or EVENT_CLICK
+        """
+        while True:
+            if self.encoder and self.encoder.update():
+                self._delay = self.poll_min
+                return EVENT_TURN
+
+            if self.controls.update():
+                self._delay = self.poll_min
+            held_ms = self.controls.take_release(self.key)
+            if held_ms >= 0:
+                if self._armed and held_ms >= self.min_hold_ms:
+                    return EVENT_CLICK
+                self._armed = True  # Too short, or held over from the last screen
+
+            # Nothing yet - back off a little more each time
+            time.sleep(self._delay)
+            self._delay = min(self._delay * 2, self.poll_max)
+
+    def wait_for_click(self):
+        """Sleep until the button is clicked (turns are ignored)"""
+        while self.wait() != EVENT_CLICK:
+            pass
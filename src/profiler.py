@@ -0,0 +1,105 @@
+# profiler.py
+# Opt-in per-stage frame profiler for the game loop
+# Keeps the last N frames in preallocated arrays and prints stats over serial
+
+import array
+import sys
+import time
+
+try:
+    import supervisor
+except ImportError:
+    supervisor = None  # Not on a board (no serial polling)
+
+# Game loop stages, in the order they start each frame
+# Input is marked twice: reading button events, then acting on them
+# (the level-up tap check runs in between)
+STAGE_INPUT = 0      # Button events, quit check, lane moves and shooting
+STAGE_ACCEL = 1      # Accelerometer tap check and timeout (level-up only)
+STAGE_EFFECTS = 2    # Sound/LED effect ticks and the victory timer
+STAGE_UPDATE = 3     # Spawning and moving entities
+STAGE_COLLISION = 4  # Collisions, scoring, level progression
+STAGE_DRAW = 5       # Drawing into the bitmap
+STAGE_HUD = 6        # HUD labels
+STAGE_SLEEP = 7      # Waiting for the frame deadline
+STAGE_REFRESH = 8    # display.refresh()
+
+STAGE_NAMES = ("input", "accel", "effects", "update", "collision", "draw",
+               "hud", "sleep", "refresh")
+
+class FrameProfiler:
+    """
+    Times each stage of the game loop with time.monotonic_ns()
+    Usage each frame: start_frame(), mark(STAGE_...) right after the work
+    it times, end_frame()
+    Storage is one array per stage, allocated once, used as a ring buffer
+    Code using this should skip the calls entirely when profiling is off
+    (profiler = None), so it costs nothing when disabled
+    """
+
+    def __init__(self, frames=120):
+        """
+        frames: how many recent frames to keep
+        """
+        self.size = frames
+        # Stage time in microseconds (fits an unsigned 32-bit slot)
+        self._data = [array.array("L", [0] * frames) for _ in STAGE_NAMES]
+        self._index = 0
+        self._count = 0
+        self._last = 0
+
+    def reset(self):
+        """Forget all recorded frames"""
+        self._index = 0
+        self._count = 0
+
+    def start_frame(self):
+        """Call at the top of the game loop"""
+        # Stages skipped this frame (e.g. no input during level-up) count as 0
+        index = self._index
+        for column in self._data:
+            column[index] = 0
+        self._last = time.monotonic_ns()
+
+    def mark(self, stage):
+        """
+        Add the time since the previous mark to stage
+        A stage can be marked more than once a frame (the times add up)
+        """
+        now = time.monotonic_ns()
+        self._data[stage][self._index] += (now - self._last) // 1000
+        self._last = now
+
+    def end_frame(self):
+        """Call at the bottom of the game loop"""
+        self._index += 1
+        if self._index >= self.size:
+            self._index = 0
+        if self._count < self.size:
+            self._count += 1
+
+    def poll_serial(self):
+        """Print a report if 'p' was typed on the serial console"""
+        if supervisor and supervisor.runtime.serial_bytes_available:
+            if sys.stdin.read(1) == "p":
+                self.report()
+
+    def report(self):
+        """Print min/mean/p95/max per stage (ms) over the recorded frames"""
+        count = self._count
+        if not count:
+            print("Profiler: no frames recorded")
+            return
+        
+        print(f"Profiler: last {count} frames (ms)")
+        print(f"{'stage':<10} {'min':>5} {'mean':>6} {'p95':>6} {'max':>6}")
+        total_mean = 0
+        for stage, name in enumerate(STAGE_NAMES):
+            # Only the report allocates (sorted copy of one stage)
+            values = sorted(self._data[stage][:count])
+            mean = sum(values) / count
+            total_mean += mean
+            p95 = values[min(count - 1, (count * 95) // 100)]
+            print(f"{name:<10} {values[0] / 1000:5.2f} {mean / 1000:6.2f} "
+                  f"{p95 / 1000:6.2f} {values[-1] / 1000:6.2f}")
+        print(f"frame total mean: {total_mean / 1000:.2f} ms")
@@ -0,0 +1,147 @@
+# renderer.py
+# Dirty-rectangle renderer for the gameplay screen
+# Only erases and redraws the parts of the bitmap that actually changed
+
+import displayio
+from graphics import (draw_grid, draw_hud, draw_targeting_reticle, draw_player,
+                      player_bounds)
+from grid_cache import GRID_TOP, grid_phase
+from blit import copy_region, fill_rect
+
+SCREEN_WIDTH = 128
+SCREEN_HEIGHT = 64
+
+def clip_rect(rect):
+    """
+    Clip (x0, y0, x1, y1) to the screen (x1/y1 exclusive)
+    Returns None if nothing is left on screen
+    """
+    if rect is None:
+        return None
+    x0, y0, x1, y1 = rect
+    x0 = max(0, x0)
+    y0 = max(0, y0)
+    x1 = min(SCREEN_WIDTH, x1)
+    y1 = min(SCREEN_HEIGHT, y1)
+    if x0 >= x1 or y0 >= y1:
+        return None
+    return (x0, y0, x1, y1)
+
+class DirtyRectRenderer:
+    """
+    Keeps a finished background (grid, reticle, HUD brackets) for each grid
+    phase and remembers where every entity was drawn last frame
+    Each frame: copy the grid rows back in if the grid moved (otherwise just
+    erase last frame's boxes from the background), then draw entities at
+    their new positions
+    Rows above the grid are only rewritten where entities were, and
+    displayio only pushes the areas we wrote to
+    """
+
+    def __init__(self, bitmap, grid_cache=None):
+        """
+        bitmap: the on-screen bitmap to draw into (GameScene.bitmap)
+        grid_cache: optional GridCache used to redraw the background grid
+        """
+        self.bitmap = bitmap
+        self.grid_cache = grid_cache
+        
+        # Finished backgrounds by grid phase, drawn the first time each is used
+        # (1 KB each, 5 of them with GRID_SCROLL_STEP = 4)
+        self.backgrounds = {}
+        self.background = None
+        self._grid_phase = None
+        self._full_copy = True
+        
+        # Boxes drawn last frame (to erase) and this frame (to erase next time)
+        self._prev_rects = []
+        self._rects = []
+
+    def invalidate(self):
+        """Force a full background copy next frame (new game, screen switch)"""
+        self._grid_phase = None
+        self._full_copy = True
+        self._prev_rects.clear()
+
+    def _new_bitmap(self):
+        """Bitmap in the same format as the screen one"""
+        if hasattr(self.bitmap, "copy_region"):
+            # Raw display framebuffer
+            return type(self.bitmap)(SCREEN_WIDTH, SCREEN_HEIGHT)
+        return displayio.Bitmap(SCREEN_WIDTH, SCREEN_HEIGHT, 2)
+
+    def _background_for(self, phase, grid_offset):
+        """The background for a grid phase (built the first time it's needed)"""
+        background = self.backgrounds.get(phase)
+        if background is None:
+            background = self._new_bitmap()
+            if self.grid_cache:
+                self.grid_cache.draw(background, grid_offset)
+            else:
+                draw_grid(background, grid_offset)
+            draw_targeting_reticle(background)
+            draw_hud(background)
+            self.backgrounds[phase] = background
+        return background
+
+    def _restore(self, rect):
+        """Copy background back into rect on the screen bitmap"""
+        copy_region(self.bitmap, self.background, *rect)
+
+    def begin_frame(self, grid_offset):
+        """
+        Start a new frame
+        grid_offset: same animation offset draw_grid() takes
+        """
+        phase = grid_phase(grid_offset)
+        
+        if phase != self._grid_phase:
+            # Grid moved - switch to that phase's background
+            self._grid_phase = phase
+            self.background = self._background_for(phase, grid_offset)
+            
+            # Rows above the grid never change, so only copy them when needed
+            top = 0 if self._full_copy else GRID_TOP
+            self._full_copy = False
+            self._restore((0, top, SCREEN_WIDTH, SCREEN_HEIGHT))
+            
+            # Old boxes above the grid still need erasing
+            for rect in self._prev_rects:
+                if rect[1] < top:
+                    self._restore(rect)
+        else:
+            # Background unchanged - just erase last frame's entities
+            for rect in self._prev_rects:
+                self._restore(rect)
+        
+        self._rects.clear()
+
+    def draw(self, entity):
+        """
+        Draw an entity that has bounds() and draw(bitmap)
+        (Obstacle, Bullet)
+        """
+        rect = clip_rect(entity.bounds())
+        if rect is None:
+            return
+        entity.draw(self.bitmap)
+        self._rects.append(rect)
+
+    def fill_rect(self, x, y, width, height):
+        """Fill a rectangle and track it (for the array entity backend)"""
+        rect = clip_rect((x, y, x + width, y + height))
+        if rect is None:
+            return
+        fill_rect(self.bitmap, x, y, width, height)
+        self._rects.append(rect)
+
+    def draw_player(self, lane_index, lane_positions):
+        """Draw the player ship and track its box"""
+        rect = clip_rect(player_bounds(lane_index, lane_positions))
+        draw_player(self.bitmap, lane_index, lane_positions)
+        if rect is not None:
+            self._rects.append(rect)
+
+    def end_frame(self):
+        """Finish the frame - this frame's boxes get erased next frame"""
+        self._prev_rects, self._rects = self._rects, self._prev_rects
@@ -1,9 +1,15 @@
 # rotary_encoder.py
 # Rotary encoder driver with quadrature decoding
-# Uses state machine to track rotation direction
+# Uses rotaryio (counted in the background) when the board has it,
+# otherwise a state machine to track rotation direction
 
 import digitalio
 
+try:
+    import rotaryio
+except ImportError:
+    rotaryio = None  # Python state machine only
+
 # Direction constants
 _DIR_CW = 0x10   # Clockwise rotation
 _DIR_CCW = 0x20  # Counter-clockwise rotation
@@ -31,20 +37,43 @@ _transition_table = [
 _STATE_MASK = 0x07
 _DIR_MASK = 0x30
 
+# Quadrature transitions per detent (one full cycle, like the state machine)
+_DETENT_DIVISOR = 4
+
 class RotaryEncoder:
     """
     Rotary encoder with quadrature decoding
     Tracks position with wrapping at min/max values
+    With rotaryio the pins are counted in the background, so update()
+    only has to be called when the value is needed, not at kHz rates
     """
     
-    def __init__(self, pin_clk, pin_dt, min_val=0, max_val=25):
+    def __init__(self, pin_clk, pin_dt, min_val=0, max_val=25, use_hardware=True):
         """
         Initialize encoder
         pin_clk: CLK pin (board.D1)
         pin_dt: DT pin (board.D0)
         min_val: minimum position value
         max_val: maximum position value
+        use_hardware: use rotaryio if available (False = Python state machine)
         """
+        # Position tracking
+        self._min_val = min_val
+        self._max_val = max_val
+        self._value = min_val
+        self._state = _R_START
+        
+        # Hardware counting (DT first so clockwise counts up like the state machine)
+        self._counter = None
+        if use_hardware and rotaryio:
+            try:
+                self._counter = rotaryio.IncrementalEncoder(pin_dt, pin_clk,
+                                                            divisor=_DETENT_DIVISOR)
+                self._position = self._counter.position
+                return
+            except (ValueError, RuntimeError) as e:
+                print(f"rotaryio not usable ({e}), decoding in Python")
+        
         # Setup CLK pin
         self._pin_clk = digitalio.DigitalInOut(pin_clk)
         self._pin_clk.direction = digitalio.Direction.INPUT
@@ -54,21 +83,30 @@ class RotaryEncoder:
         self._pin_dt = digitalio.DigitalInOut(pin_dt)
         self._pin_dt.direction = digitalio.Direction.INPUT
         self._pin_dt.pull = digitalio.Pull.UP
-        
-        # Position tracking
-        self._min_val = min_val
-        self._max_val = max_val
-        self._value = min_val
-        self._state = _R_START
+    
+    @property
+    def hardware(self):
+        """True if rotaryio is doing the decoding"""
+        return self._counter is not None
         
     def update(self):
         """
         Read encoder and update position
-        Call this every loop iteration
+        Call this every loop iteration (with rotaryio, whenever convenient)
         Returns True if position changed
         """
         old_value = self._value
         
+        if self._counter is not None:
+            # Apply every detent counted since the last update, with wrap-around
+            position = self._counter.position
+            steps = position - self._position
+            if steps:
+                self._position = position
+                span = self._max_val - self._min_val + 1
+                self._value = self._min_val + (self._value - self._min_val + steps) % span
+            return old_value != self._value
+        
         # Read both pins and combine into 2-bit value
         clk_dt_pins = (self._pin_clk.value << 1) | self._pin_dt.value
         
@@ -95,4 +133,11 @@ class RotaryEncoder:
     
     def reset(self, val=0):
         """Reset position to specific value"""
-        self._value = val
\ No newline at end of file
+        self._value = val
+        if self._counter is not None:
+            self._position = self._counter.position  # Forget uncounted turns
+    
+    def set_range(self, min_val, max_val):
+        """Change the wrap-around range (e.g. 0-3 for the menu, 0-25 for A-Z)"""
+        self._min_val = min_val
+        self._max_val = max_val
\ No newline at end of file
@@ -0,0 +1,141 @@
+# sample_audio.py
+# Optional sample playback backend for sound effects (audiopwmio)
+# Effects are rendered once at startup into 8-bit waveforms and played by DMA,
+# so the CPU does no work while they play
+
+import audiocore
+
+SAMPLE_RATE = 8000    # Samples per second for pre-rendered effects
+MIDPOINT = 128        # Silence level for unsigned 8-bit samples
+AMPLITUDE = 32        # Square wave swing around MIDPOINT (about 25% volume)
+TONE_CYCLE = 16       # Samples in one cycle of the looping tone
+
+def effect_length(steps):
+    """Total length of an effect in ms"""
+    return sum(duration_ms for _, duration_ms in steps)
+
+def render_effect(steps, sample_rate=SAMPLE_RATE):
+    """
+    Render a (frequency Hz, duration ms) step list into a square wave
+    Returns a bytearray of unsigned 8-bit samples
+    """
+    total = sum(duration_ms * sample_rate // 1000 for _, duration_ms in steps)
+    buffer = bytearray(total)
+    high, low = MIDPOINT + AMPLITUDE, MIDPOINT - AMPLITUDE
+
+    i = 0
+    for freq, duration_ms in steps:
+        count = duration_ms * sample_rate // 1000
+        if freq <= 0:
+            for k in range(count):
+                buffer[i + k] = MIDPOINT
+        else:
+            # Half-cycle number decides high or low (integer math only)
+            for k in range(count):
+                half_cycles = (k * freq * 2) // sample_rate
+                buffer[i + k] = low if half_cycles & 1 else high
+        i += count
+    return buffer
+
+class SampleBank:
+    """
+    Pre-rendered effects that fit in a memory budget
+    Effects are rendered in the order given, skipping any that don't fit
+    (those keep using the tone API)
+    """
+
+    def __init__(self, effects, max_bytes=16384, sample_rate=SAMPLE_RATE):
+        """
+        effects: list of SFX_ step tables, most important first
+        max_bytes: memory budget for all samples together
+        """
+        self.samples = {}  # step table -> (RawSample, length ms)
+        self.used_bytes = 0
+
+        for steps in effects:
+            size = effect_length(steps) * sample_rate // 1000
+            if self.used_bytes + size > max_bytes:
+                print(f"Sample cache: skipping {effect_length(steps)} ms effect (over budget)")
+                continue
+            buffer = render_effect(steps, sample_rate)
+            sample = audiocore.RawSample(buffer, sample_rate=sample_rate)
+            self.samples[steps] = (sample, effect_length(steps))
+            self.used_bytes += size
+
+        print(f"Sample cache: {len(self.samples)} effects, {self.used_bytes} bytes")
+
+class SamplePlayer:
+    """Plays SampleBank effects on a PWMAudioOut"""
+
+    def __init__(self, audio_out, bank):
+        self.audio_out = audio_out
+        self.bank = bank
+
+    def play(self, steps):
+        """
+        Start an effect if it was pre-rendered
+        Returns its length in ms, or 0 if it isn't cached
+        """
+        entry = self.bank.samples.get(steps)
+        if entry is None:
+            return 0
+        sample, length_ms = entry
+        if self.audio_out.playing:
+            self.audio_out.stop()
+        self.audio_out.play(sample)
+        return length_ms
+
+    def stop(self):
+        """Stop whatever is playing"""
+        if self.audio_out.playing:
+            self.audio_out.stop()
+
+class ToneShim:
+    """
+    Stands in for the pwmio buzzer when the pin belongs to PWMAudioOut
+    Same frequency/duty_cycle attributes, so play_tone() and menus still work
+    A tone is one looping square wave cycle played at frequency * TONE_CYCLE
+    """
+
+    def __init__(self, audio_out):
+        self.audio_out = audio_out
+        half = TONE_CYCLE // 2
+        self._cycle = bytearray([MIDPOINT + AMPLITUDE] * half +
+                                [MIDPOINT - AMPLITUDE] * half)
+        self._frequency = 440
+        self._duty_cycle = 0
+        self._sample = None
+
+    @property
+    def frequency(self):
+        return self._frequency
+
+    @frequency.setter
+    def frequency(self, value):
+        if value != self._frequency:
+            self._frequency = value
+            if self._duty_cycle:
+                self._start()
+
+    @property
+    def duty_cycle(self):
+        return self._duty_cycle
+
+    @duty_cycle.setter
+    def duty_cycle(self, value):
+        if value and not self._duty_cycle:
+            self._duty_cycle = value
+            self._start()
+        elif not value and self._duty_cycle:
+            self._duty_cycle = 0
+            self.audio_out.stop()
+        else:
+            self._duty_cycle = value
+
+    def _start(self):
+        """(Re)start the looping tone at the current frequency"""
+        if self.audio_out.playing:
+            self.audio_out.stop()
+        self._sample = audiocore.RawSample(self._cycle,
+                                           sample_rate=self._frequency * TONE_CYCLE)
+        self.audio_out.play(self._sample, loop=True)
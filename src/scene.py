@@ -0,0 +1,157 @@
+# scene.py
+# Retained display objects for the gameplay screen
+# Built once per game so the frame loop doesn't allocate new Groups, Bitmaps and Labels
+
+import displayio
+import terminalio
+from adafruit_display_text import label
+from text_blit import GlyphAtlas, TextSlot, HUD_CHARS
+
+# HUD text modes (HUD_TEXT in config.py)
+TEXT_LABELS = "labels"  # One Label per HUD item
+TEXT_BLIT = "blit"      # Glyphs copied into one overlay bitmap (text_blit.py)
+
+class GameScene:
+    """
+    Owns the bitmap, palette, tile grid and HUD labels for gameplay
+    Each frame: clear(), draw into scene.bitmap, then update the HUD
+    Labels are only touched when their text or color actually changes
+    """
+
+    def __init__(self, width=128, height=64, text_mode=TEXT_LABELS, raw=None):
+        """
+        Build the whole display tree once
+        width, height: screen size in pixels
+        text_mode: TEXT_LABELS or TEXT_BLIT
+        raw: RawSSD1306 to draw into instead of displayio (text is then
+             always blitted, into the driver's overlay)
+        """
+        self.raw = raw
+        self.inverted = False
+        self.text_bitmap = None
+        self.text_palette = None
+
+        if raw:
+            # No displayio objects: the driver's framebuffers are the scene
+            self.group = None
+            self.bitmap = raw.bitmap
+            self.atlas = GlyphAtlas(terminalio.FONT, HUD_CHARS)
+            self.text_bitmap = raw.overlay
+            text_mode = None
+        else:
+            self.group = displayio.Group()
+            self.bitmap = displayio.Bitmap(width, height, 2)
+            self.palette = displayio.Palette(2)
+            self.palette[0], self.palette[1] = 0x000000, 0xFFFFFF
+
+            self.tile_grid = displayio.TileGrid(self.bitmap, pixel_shader=self.palette)
+            self.group.append(self.tile_grid)
+
+        # Blit mode: HUD text lives in a transparent bitmap over the game
+        # (so the game bitmap can be cleared or partly redrawn freely)
+        if text_mode == TEXT_BLIT:
+            self.atlas = GlyphAtlas(terminalio.FONT, HUD_CHARS)
+            self.text_bitmap = displayio.Bitmap(width, height, 2)
+            self.text_palette = displayio.Palette(2)
+            self.text_palette[1] = 0xFFFFFF
+            self.text_palette.make_transparent(0)
+            self.group.append(displayio.TileGrid(self.text_bitmap,
+                                                 pixel_shader=self.text_palette))
+
+        # HUD labels (same positions the old per-frame labels used)
+        self.win_label = self._add_label("YOU WIN!", 42, 4)
+        self.score_label = self._add_label("SC:0", 4, 8)
+        self.level_label = self._add_label("LVL:0", 92, 8)
+        self.tap_label = self._add_label("TAP!", 50, 28)
+        self.timer_label = self._add_label("5", 60, 40)
+
+        # Optional labels start hidden
+        self.win_label.hidden = True
+        self.tap_label.hidden = True
+        self.timer_label.hidden = True
+
+        # Last values shown, so unchanged values cost nothing
+        self._score = None
+        self._level = None
+        self._seconds_left = None
+
+    def _add_label(self, text, x, y):
+        """Create a white label at (x, y) and add it to the scene"""
+        if self.text_bitmap:
+            return TextSlot(self.atlas, self.text_bitmap, x, y, text)
+        new_label = label.Label(terminalio.FONT, text=text, color=0xFFFFFF)
+        new_label.x, new_label.y = x, y
+        self.group.append(new_label)
+        return new_label
+
+    def add_layer(self, layer):
+        """
+        Put a Group (e.g. SpriteLayer.group) above the bitmap but under the HUD text
+        (not with a raw display)
+        """
+        self.group.insert(1, layer)
+
+    def reset(self):
+        """Put the HUD back to its start-of-game state"""
+        self.set_inverted(False)
+        self.show_win(False)
+        self.show_tap(False)
+        self.clear()
+
+    def clear(self):
+        """Clear the bitmap for the next frame"""
+        self.bitmap.fill(0)
+
+    def set_inverted(self, inverted):
+        """Swap black/white for the level-up sequence"""
+        if inverted == self.inverted:
+            return
+        self.inverted = inverted
+
+        if self.raw:
+            self.raw.set_inverted(inverted)  # Panel inverts text and all
+            return
+
+        if inverted:
+            self.palette[0], self.palette[1] = 0xFFFFFF, 0x000000
+        else:
+            self.palette[0], self.palette[1] = 0x000000, 0xFFFFFF
+
+        # Text color follows the palette
+        text_color = 0x000000 if inverted else 0xFFFFFF
+        if self.text_palette:
+            self.text_palette[1] = text_color
+            return
+        for hud_label in (self.win_label, self.score_label, self.level_label,
+                          self.tap_label, self.timer_label):
+            hud_label.color = text_color
+
+    def set_score(self, score):
+        """Update score label (only if the score changed)"""
+        if score != self._score:
+            self._score = score
+            self.score_label.text = f"SC:{score}"
+
+    def set_level(self, level):
+        """Update level label (only if the level changed)"""
+        if level != self._level:
+            self._level = level
+            self.level_label.text = f"LVL:{level}"
+
+    def show_win(self, visible):
+        """Show or hide the YOU WIN! message"""
+        if self.win_label.hidden == visible:
+            self.win_label.hidden = not visible
+
+    def show_tap(self, visible, seconds_left=0):
+        """
+        Show or hide the TAP! prompt and countdown
+        seconds_left: whole seconds to display under the prompt
+        """
+        if self.tap_label.hidden == visible:
+            self.tap_label.hidden = not visible
+            self.timer_label.hidden = not visible
+
+        if visible and seconds_left != self._seconds_left:
+            self._seconds_left = seconds_left
+            self.timer_label.text = f"{seconds_left}"
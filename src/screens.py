@@ -0,0 +1,152 @@
+# screens.py
+# Menu, high scores, initials and game over screens, built once and reused
+# Switching screens is just display.root_group = screen.group; only the
+# labels that change (arrow, scores, initials, final score) are updated
+
+import displayio
+import terminalio
+from adafruit_display_text import label
+from graphics import draw_folder
+from blit import fill_rect
+
+MENU_OPTIONS = ("Easy", "Medium", "Hard", "Scores")
+
+def _add_label(group, text, x, y):
+    """Create a white label at (x, y) and add it to group"""
+    new_label = label.Label(terminalio.FONT, text=text, color=0xFFFFFF)
+    new_label.x, new_label.y = x, y
+    group.append(new_label)
+    return new_label
+
+class MenuScreen:
+    """Windows desktop style menu: folder icons, taskbar, selection arrow"""
+
+    def __init__(self):
+        self.group = displayio.Group()
+        bitmap = displayio.Bitmap(128, 64, 2)
+        palette = displayio.Palette(2)
+        palette[0], palette[1] = 0x000000, 0xFFFFFF
+
+        # Draw folder icons
+        for i in range(len(MENU_OPTIONS)):
+            draw_folder(bitmap, 2, i * 12 + 2)
+
+        # Draw taskbar at bottom
+        fill_rect(bitmap, 0, 56, 128, 8)
+
+        self.group.append(displayio.TileGrid(bitmap, pixel_shader=palette))
+
+        # Option text
+        for i, option in enumerate(MENU_OPTIONS):
+            _add_label(self.group, option, 10, 4 + i * 12)
+
+        # One selection arrow, moved to the selected option
+        self.arrow = _add_label(self.group, ">", 115, 4)
+        self.selected = 0
+
+    def select(self, index):
+        """Move the arrow to option index"""
+        if index != self.selected:
+            self.selected = index
+            self.arrow.y = 4 + index * 12
+
+class HighscoresScreen:
+    """Top 5 list (score labels only change when the list does)"""
+
+    def __init__(self):
+        # No bitmap: the display shows black wherever the group has nothing
+        self.group = displayio.Group()
+        _add_label(self.group, "HIGH SCORES", 22, 4)
+        self.score_labels = [_add_label(self.group, " ", 10, 16 + i * 9)
+                             for i in range(5)]
+        _add_label(self.group, "Press to exit", 18, 56)
+        self._scores = None
+
+    def set_scores(self, highscores):
+        """Show a list of (name, score) tuples"""
+        if highscores == self._scores:
+            return
+        self._scores = list(highscores)
+        for i, (name, score) in enumerate(highscores):
+            score_text = f"{i+1}. {name} {score}"
+            if self.score_labels[i].text != score_text:
+                self.score_labels[i].text = score_text
+
+class InitialsScreen:
+    """Three letters with an underline cursor under the one being edited"""
+
+    def __init__(self):
+        self.group = displayio.Group()
+        _add_label(self.group, "ENTER INITIALS", 16, 8)
+        self.initials_label = _add_label(self.group, "A A A", 46, 28)
+        self.cursor = _add_label(self.group, "_", 46, 34)
+
+    def reset(self):
+        """Back to A A A with the cursor on the first letter"""
+        self.set_initials("AAA")
+        self.set_position(0)
+
+    def set_initials(self, initials):
+        """Show the letters (list or string of 3)"""
+        text = f"{initials[0]} {initials[1]} {initials[2]}"
+        if self.initials_label.text != text:
+            self.initials_label.text = text
+
+    def set_position(self, position):
+        """Move the cursor under letter position (3 = all done, no cursor)"""
+        self.cursor.hidden = position >= 3
+        self.cursor.x = 46 + min(position, 2) * 12
+
+class GameOverScreen:
+    """GAME OVER and the final score"""
+
+    def __init__(self):
+        self.group = displayio.Group()
+        _add_label(self.group, "GAME OVER", 34, 24)
+        self.score_label = _add_label(self.group, "Score: 0", 38, 40)
+        self._score = 0
+
+    def set_score(self, score):
+        """Show the final score"""
+        if score != self._score:
+            self._score = score
+            self.score_label.text = f"Score: {score}"
+
+class ScreenCache:
+    """
+    Each screen is built the first time it's needed and kept after that
+    (uses a few KB of RAM for the Groups and Labels)
+    """
+
+    def __init__(self):
+        self._menu = None
+        self._highscores = None
+        self._initials = None
+        self._game_over = None
+
+    @property
+    def menu(self):
+        if self._menu is None:
+            self._menu = MenuScreen()
+        return self._menu
+
+    @property
+    def highscores(self):
+        if self._highscores is None:
+            self._highscores = HighscoresScreen()
+        return self._highscores
+
+    @property
+    def initials(self):
+        if self._initials is None:
+            self._initials = InitialsScreen()
+        return self._initials
+
+    @property
+    def game_over(self):
+        if self._game_over is None:
+            self._game_over = GameOverScreen()
+        return self._game_over
+
+# Shared by menu.py and code.py
+screen_cache = ScreenCache()
@@ -1,10 +1,50 @@
 # sounds.py
 # All sound effects for my game
 # Uses PWM buzzer to play different tones and melodies
+# Effects are lists of (frequency Hz, duration ms) steps, 0 Hz = silence
+# They can be played blocking (menus) or through SoundSequencer (gameplay)
+# If use_samples() was called, pre-rendered effects play by DMA instead
 
 import time
 import math
 
+VOLUME = 16384  # 25% duty cycle to avoid being too loud
+
+# Effect priorities for SoundSequencer (higher interrupts lower)
+PRIORITY_DODGE = 0
+PRIORITY_BLASTER = 1
+PRIORITY_VICTORY = 2
+PRIORITY_GAME_OVER = 3
+
+# Quick beep when selecting menu items
+SFX_SELECTION = ((800, 50), (1000, 50))
+
+# Laser sweep when shooting
+SFX_BLASTER = tuple((freq, 10) for freq in range(800, 200, -50))
+
+# Quick swoosh when changing lanes
+SFX_DODGE = ((600, 50), (0, 10), (800, 50))
+
+# Sad descending tones with vibrato (varies frequency slightly)
+SFX_GAME_OVER = tuple((note + int(10 * math.sin(i * 0.5)), 60)
+                      for note in (466, 440, 415, 392) for i in range(8))
+
+# Happy ascending fanfare
+SFX_VICTORY = ((523, 150), (659, 150), (784, 150), (1047, 400))
+
+# Classic Windows startup sound
+SFX_WINDOWS = ((622, 350), (0, 50), (415, 250), (0, 50), (932, 250), (0, 50),
+               (831, 200), (0, 50), (311, 300), (0, 50), (622, 350), (0, 50),
+               (466, 500))
+
+# SamplePlayer from sample_audio.py (None = tones only)
+_samples = None
+
+def use_samples(player):
+    """Play pre-rendered effects through a SamplePlayer when available"""
+    global _samples
+    _samples = player
+
 def play_tone(buzzer, frequency, duration):
     """
     Play a single tone on the buzzer
@@ -14,59 +54,134 @@ def play_tone(buzzer, frequency, duration):
     """
     if frequency > 0:
         buzzer.frequency = frequency
-        buzzer.duty_cycle = 16384  # 25% volume to avoid being too loud
+        buzzer.duty_cycle = VOLUME
     time.sleep(duration)
     buzzer.duty_cycle = 0  # Turn off sound
 
+def play_steps(buzzer, steps):
+    """Play a whole effect, blocking until it's done"""
+    if _samples:
+        length_ms = _samples.play(steps)
+        if length_ms:
+            time.sleep(length_ms / 1000)
+            return
+    
+    for freq, duration_ms in steps:
+        if freq > 0:
+            buzzer.frequency = freq
+            buzzer.duty_cycle = VOLUME
+        else:
+            buzzer.duty_cycle = 0
+        time.sleep(duration_ms / 1000)
+    buzzer.duty_cycle = 0
+
 def sound_selection(buzzer):
     """Quick beep when selecting menu items"""
-    play_tone(buzzer, 800, 0.05)
-    play_tone(buzzer, 1000, 0.05)
+    play_steps(buzzer, SFX_SELECTION)
 
 def sound_blaster(buzzer):
     """Laser sound effect when shooting"""
-    for freq in range(800, 200, -50):
-        buzzer.frequency = freq
-        buzzer.duty_cycle = 16384
-        time.sleep(0.01)
-    buzzer.duty_cycle = 0
+    play_steps(buzzer, SFX_BLASTER)
 
 def sound_dodge(buzzer):
     """Quick swoosh when changing lanes"""
-    play_tone(buzzer, 600, 0.05)
-    time.sleep(0.01)
-    play_tone(buzzer, 800, 0.05)
+    play_steps(buzzer, SFX_DODGE)
 
 def sound_game_over(buzzer):
     """Sad descending tones with vibrato when you lose"""
-    notes = [466, 440, 415, 392]
-    for note in notes:
-        # Add vibrato effect by varying frequency slightly
-        for i in range(8):
-            offset = int(10 * math.sin(i * 0.5))
-            buzzer.frequency = note + offset
-            buzzer.duty_cycle = 16384
-            time.sleep(0.06)
-    buzzer.duty_cycle = 0
+    play_steps(buzzer, SFX_GAME_OVER)
 
 def sound_victory(buzzer):
     """Happy ascending fanfare when reaching level 10"""
-    notes = [(523, 0.15), (659, 0.15), (784, 0.15), (1047, 0.4)]
-    for freq, duration in notes:
-        play_tone(buzzer, freq, duration)
+    play_steps(buzzer, SFX_VICTORY)
 
 def play_windows_sound(buzzer):
     """Classic Windows startup sound"""
-    play_tone(buzzer, 622, 0.35)
-    time.sleep(0.05)
-    play_tone(buzzer, 415, 0.25)
-    time.sleep(0.05)
-    play_tone(buzzer, 932, 0.25)
-    time.sleep(0.05)
-    play_tone(buzzer, 831, 0.20)
-    time.sleep(0.05)
-    play_tone(buzzer, 311, 0.30)
-    time.sleep(0.05)
-    play_tone(buzzer, 622, 0.35)
-    time.sleep(0.05)
-    play_tone(buzzer, 466, 0.50)
\ No newline at end of file
+    play_steps(buzzer, SFX_WINDOWS)
+
+def _now_ms():
+    """Milliseconds clock (integer, doesn't lose precision like monotonic())"""
+    return time.monotonic_ns() // 1000000
+
+class SoundSequencer:
+    """
+    Non-blocking effect player for the game loop
+    play() starts an effect, tick() (once per frame) moves to the next step
+    when its time is up. The buzzer is only touched at step boundaries
+    """
+
+    def __init__(self, buzzer):
+        """buzzer: PWM buzzer object"""
+        self.buzzer = buzzer
+        self.priority = 0
+        self._steps = None
+        self._index = 0
+        self._step_end = 0
+
+    @property
+    def busy(self):
+        """True while an effect is playing"""
+        return self._steps is not None
+
+    def play(self, steps, priority=0):
+        """
+        Start an effect (one of the SFX_ tables)
+        Interrupts the current effect unless it has a higher priority
+        Returns True if the effect started
+        """
+        if self._steps is not None and priority < self.priority:
+            return False
+        self._steps = steps
+        self._index = 0
+        self.priority = priority
+        
+        # Pre-rendered sample: DMA plays it, we just wait for it to end
+        if _samples:
+            self.buzzer.duty_cycle = 0
+            _samples.stop()
+            length_ms = _samples.play(steps)
+            if length_ms:
+                self._index = len(steps) - 1
+                self._step_end = _now_ms() + length_ms
+                return True
+        
+        self._step_end = _now_ms() + steps[0][1]
+        self._output(steps[0][0])
+        return True
+
+    def tick(self):
+        """Advance the current effect - call once per frame"""
+        if self._steps is None:
+            return
+        now = _now_ms()
+        if now < self._step_end:
+            return
+
+        # Skip any steps that ended since the last tick
+        steps = self._steps
+        index = self._index
+        while now >= self._step_end:
+            index += 1
+            if index >= len(steps):
+                self.stop()
+                return
+            self._step_end += steps[index][1]
+
+        self._index = index
+        self._output(steps[index][0])
+
+    def stop(self):
+        """Silence the buzzer and drop the current effect"""
+        self.buzzer.duty_cycle = 0
+        if _samples:
+            _samples.stop()
+        self._steps = None
+        self.priority = 0
+
+    def _output(self, freq):
+        """Set the buzzer for one step"""
+        if freq > 0:
+            self.buzzer.frequency = freq
+            self.buzzer.duty_cycle = VOLUME
+        else:
+            self.buzzer.duty_cycle = 0
@@ -0,0 +1,92 @@
+# sprites.py
+# Hardware-compositor render mode: moving things are TileGrids, not pixels
+# displayio composites the sprites over the background, so the bitmap is never touched for them
+
+import displayio
+from graphics import draw_player_at, PLAYER_Y, PLAYER_HALF_WIDTH, PLAYER_HEIGHT
+from blit import fill_rect
+
+OBSTACLE_WIDTH, OBSTACLE_HEIGHT = 16, 6
+BULLET_SIZE = 3
+
+class SpriteLayer:
+    """
+    Pre-drawn sprite bitmaps plus a fixed pool of TileGrids per entity type
+    Obstacle/Bullet.attach_sprite() takes a TileGrid from here and moves it in update()
+    A TileGrid goes back to the pool by being hidden
+    """
+
+    def __init__(self, max_obstacles=6, max_bullets=8):
+        """
+        max_obstacles, max_bullets: how many of each can be on screen at once
+        (the entity pool sizes, so every live entity gets a TileGrid)
+        """
+        self.group = displayio.Group()
+        
+        # Index 0 is see-through so the grid shows around each sprite
+        self.palette = displayio.Palette(2)
+        self.palette[1] = 0xFFFFFF
+        self.palette.make_transparent(0)
+        self.inverted = False
+        
+        # Pre-draw one bitmap per entity type (shared by all its TileGrids)
+        obstacle_bitmap = displayio.Bitmap(OBSTACLE_WIDTH, OBSTACLE_HEIGHT, 2)
+        fill_rect(obstacle_bitmap, 0, 0, OBSTACLE_WIDTH, OBSTACLE_HEIGHT)
+        
+        bullet_bitmap = displayio.Bitmap(BULLET_SIZE, BULLET_SIZE, 2)
+        fill_rect(bullet_bitmap, 0, 0, BULLET_SIZE, BULLET_SIZE)
+        
+        player_bitmap = displayio.Bitmap(PLAYER_HALF_WIDTH * 2 + 1, PLAYER_HEIGHT, 2)
+        draw_player_at(player_bitmap, PLAYER_HALF_WIDTH, 0)
+        
+        self.obstacles = self._make_pool(obstacle_bitmap, max_obstacles)
+        self.bullets = self._make_pool(bullet_bitmap, max_bullets)
+        
+        self.player = displayio.TileGrid(player_bitmap, pixel_shader=self.palette)
+        self.player.y = PLAYER_Y
+        self.group.append(self.player)
+
+    def _make_pool(self, bitmap, count):
+        """Create count hidden TileGrids that all show bitmap"""
+        pool = []
+        for _ in range(count):
+            tile = displayio.TileGrid(bitmap, pixel_shader=self.palette)
+            tile.hidden = True
+            self.group.append(tile)
+            pool.append(tile)
+        return pool
+
+    def _acquire(self, pool):
+        """First hidden TileGrid in pool, or None if all are in use"""
+        for tile in pool:
+            if tile.hidden:
+                return tile
+        return None
+
+    def acquire_obstacle(self):
+        """Free obstacle TileGrid (None if too many obstacles on screen)"""
+        return self._acquire(self.obstacles)
+
+    def acquire_bullet(self):
+        """Free bullet TileGrid (None if too many bullets on screen)"""
+        return self._acquire(self.bullets)
+
+    def place_player(self, lane_index, lane_positions):
+        """Move the ship sprite to the player's lane"""
+        x = lane_positions[lane_index] - PLAYER_HALF_WIDTH
+        if self.player.x != x:
+            self.player.x = x
+
+    def set_inverted(self, inverted):
+        """Match the scene palette during the level-up inversion"""
+        if inverted != self.inverted:
+            self.inverted = inverted
+            self.palette[1] = 0x000000 if inverted else 0xFFFFFF
+
+    def reset(self):
+        """Hide every sprite (start of a new game)"""
+        for tile in self.obstacles:
+            tile.hidden = True
+        for tile in self.bullets:
+            tile.hidden = True
+        self.set_inverted(False)
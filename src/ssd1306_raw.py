@@ -0,0 +1,275 @@
+# ssd1306_raw.py
+# Direct SSD1306 driver for gameplay (DISPLAY_DRIVER = "raw" in config.py)
+# Keeps a 1 KB page-organized framebuffer and only sends the pages/columns
+# that differ from what the panel already shows - no displayio in between
+
+from adafruit_bus_device.i2c_device import I2CDevice
+
+# SSD1306 commands
+_SET_MEM_ADDR = 0x20    # Addressing mode (0 = horizontal)
+_SET_COL_ADDR = 0x21    # Column window: start, end
+_SET_PAGE_ADDR = 0x22   # Page window: start, end
+_NORMAL_DISPLAY = 0xA6
+_INVERT_DISPLAY = 0xA7
+
+# First byte of every I2C write says what follows
+_CONTROL_COMMAND = 0x00
+_CONTROL_DATA = 0x40
+
+_CLEAN = 255  # Dirty range start of a page with no changes
+
+_blanks = {}  # Buffer size -> zero bytes, shared by every PageBitmap's fill(0)
+
+def _page_mask(page, y0, y1):
+    """Bits of page (8 rows) that fall inside rows y0-y1 (y1 exclusive)"""
+    top = max(y0 - page * 8, 0)
+    bottom = min(y1 - page * 8, 8)
+    return ((1 << bottom) - 1) & ~((1 << top) - 1)
+
+class PageBitmap:
+    """
+    1-bit bitmap stored the way the SSD1306 wants it: pages of 8 rows,
+    one byte per column per page (bit 0 = top row of the page)
+    Same [x, y] and fill() as displayio.Bitmap, plus the region calls blit.py
+    hands it, so graphics.py draws into it unchanged
+    Changes are recorded per page as a column range for the driver
+    """
+
+    def __init__(self, width=128, height=64):
+        self.width = width
+        self.height = height
+        self.pages = (height + 7) // 8
+        self.buffer = bytearray(width * self.pages)
+        if len(self.buffer) not in _blanks:
+            _blanks[len(self.buffer)] = bytes(len(self.buffer))
+        self._blank = _blanks[len(self.buffer)]
+
+        # Columns changed per page since the last refresh (x1 exclusive)
+        self.dirty_x0 = bytearray([_CLEAN]) * self.pages
+        self.dirty_x1 = bytearray(self.pages)
+
+    def _mark(self, x0, y0, x1, y1):
+        """Record that the box (x0, y0)-(x1, y1) may have changed"""
+        for page in range(y0 >> 3, ((y1 - 1) >> 3) + 1):
+            if x0 < self.dirty_x0[page]:
+                self.dirty_x0[page] = x0
+            if x1 > self.dirty_x1[page]:
+                self.dirty_x1[page] = x1
+
+    def clear_dirty(self):
+        """Forget recorded changes (after they were sent)"""
+        for page in range(self.pages):
+            self.dirty_x0[page] = _CLEAN
+            self.dirty_x1[page] = 0
+
+    def __getitem__(self, xy):
+        x, y = xy
+        return (self.buffer[(y >> 3) * self.width + x] >> (y & 7)) & 1
+
+    def __setitem__(self, xy, value):
+        x, y = xy
+        index = (y >> 3) * self.width + x
+        old = self.buffer[index]
+        if value:
+            new = old | (1 << (y & 7))
+        else:
+            new = old & ~(1 << (y & 7))
+        if new != old:
+            self.buffer[index] = new
+            page = y >> 3
+            if x < self.dirty_x0[page]:
+                self.dirty_x0[page] = x
+            if x >= self.dirty_x1[page]:
+                self.dirty_x1[page] = x + 1
+
+    def fill(self, value):
+        """Set every pixel to value (0 or 1)"""
+        if value:
+            self.buffer[:] = bytes([0xFF]) * len(self.buffer)
+        else:
+            self.buffer[:] = self._blank
+        self._mark(0, 0, self.width, self.height)
+
+    def fill_region(self, x0, y0, x1, y1, value):
+        """Fill the box (x0, y0)-(x1, y1), already clipped (blit.fill_rect)"""
+        buffer = self.buffer
+        for page in range(y0 >> 3, ((y1 - 1) >> 3) + 1):
+            mask = _page_mask(page, y0, y1)
+            base = page * self.width
+            if value:
+                for i in range(base + x0, base + x1):
+                    buffer[i] |= mask
+            else:
+                mask = ~mask
+                for i in range(base + x0, base + x1):
+                    buffer[i] &= mask
+        self._mark(x0, y0, x1, y1)
+
+    def copy_region(self, source, x0, y0, x1, y1):
+        """Copy the same box from source, already clipped (blit.copy_region)"""
+        if not isinstance(source, PageBitmap):
+            for y in range(y0, y1):
+                for x in range(x0, x1):
+                    self[x, y] = source[x, y]
+            return
+        buffer, source_buffer = self.buffer, source.buffer
+        for page in range(y0 >> 3, ((y1 - 1) >> 3) + 1):
+            mask = _page_mask(page, y0, y1)
+            start = page * self.width + x0
+            end = start + x1 - x0
+            if mask == 0xFF:
+                buffer[start:end] = source_buffer[start:end]  # Whole rows of bytes
+            else:
+                keep = ~mask
+                for i in range(start, end):
+                    buffer[i] = (buffer[i] & keep) | (source_buffer[i] & mask)
+        self._mark(x0, y0, x1, y1)
+
+    def blit_region(self, source, x, y, sx0, sy0, sx1, sy1, transparent=True):
+        """
+        Draw source's box (sx0, sy0)-(sx1, sy1) at (x, y), already clipped
+        (blit.blit_region). Fast when source is a PageBitmap at the same spot
+        (cached grid frames), pixel by pixel otherwise (glyphs)
+        """
+        if not (isinstance(source, PageBitmap) and x == sx0 and y == sy0):
+            for sy in range(sy0, sy1):
+                for sx in range(sx0, sx1):
+                    value = source[sx, sy]
+                    if value or not transparent:
+                        self[x + sx - sx0, y + sy - sy0] = value
+            return
+        if not transparent:
+            self.copy_region(source, sx0, sy0, sx1, sy1)
+            return
+        buffer, source_buffer = self.buffer, source.buffer
+        for page in range(sy0 >> 3, ((sy1 - 1) >> 3) + 1):
+            mask = _page_mask(page, sy0, sy1)
+            start = page * self.width + sx0
+            for i in range(start, start + sx1 - sx0):
+                buffer[i] |= source_buffer[i] & mask
+        self._mark(sx0, sy0, sx1, sy1)
+
+class RawSSD1306:
+    """
+    Drives the OLED directly while a game runs
+    bitmap: what the game draws (PageBitmap)
+    overlay: HUD text, ORed over bitmap when sent
+    refresh() goes through the pages that changed, skips columns the
+    panel already shows and sends each page's remaining column range
+    with one column/page window command and one data write
+    Has auto_refresh and refresh() like a displayio display, so
+    FrameScheduler can drive it
+    """
+
+    def __init__(self, i2c, display=None, address=0x3C, width=128, height=64):
+        """
+        i2c: the bus the panel is on (shared with displayio)
+        display: the displayio display that owns the panel the rest of the time
+        address: panel I2C address
+        """
+        self.device = I2CDevice(i2c, address)
+        self.display = display
+        self.width = width
+        self.bitmap = PageBitmap(width, height)
+        self.overlay = PageBitmap(width, height)
+        self.inverted = False
+        self.auto_refresh = False
+        self.bytes_sent = 0  # Data bytes sent since begin() (for benchmarks)
+
+        # What the panel is showing, and preallocated I2C buffers
+        self._sent = bytearray(len(self.bitmap.buffer))
+        self._force = True
+        self._command = bytearray(7)
+        self._command[0] = _CONTROL_COMMAND
+        self._data = bytearray(width + 1)  # Control byte + one page of columns
+        self._blank_group = None
+
+    def _send_command(self, *command):
+        """Send a few command bytes (not used per frame)"""
+        with self.device as device:
+            device.write(bytes((_CONTROL_COMMAND,) + command))
+
+    def begin(self):
+        """Take the panel over from displayio (start of a game)"""
+        if self.display:
+            self.display.auto_refresh = False  # displayio must not touch the bus now
+        self._send_command(_SET_MEM_ADDR, 0x00)
+        self.bytes_sent = 0
+        self.inverted = False
+        self._send_command(_NORMAL_DISPLAY)
+        self.invalidate()
+
+    def end(self):
+        """Give the panel back to displayio, which redraws it from scratch"""
+        self.set_inverted(False)
+        if self.display:
+            import displayio
+            if self._blank_group is None:
+                self._blank_group = displayio.Group()
+            # A different root group makes displayio redraw the whole screen
+            self.display.root_group = self._blank_group
+            self.display.auto_refresh = True
+
+    def invalidate(self):
+        """Send every page next refresh (panel contents unknown)"""
+        self._force = True
+
+    def set_inverted(self, inverted):
+        """Swap black/white for the whole panel (level-up sequence)"""
+        if inverted != self.inverted:
+            self.inverted = inverted
+            self._send_command(_INVERT_DISPLAY if inverted else _NORMAL_DISPLAY)
+
+    def refresh(self, target_frames_per_second=None, minimum_frames_per_second=0):
+        """
+        Send what changed since the last refresh
+        Arguments are ignored (same call as displayio's refresh())
+        Returns True
+        """
+        bitmap, overlay = self.bitmap, self.overlay
+        buffer, over, sent = bitmap.buffer, overlay.buffer, self._sent
+        data, command = self._data, self._command
+        width = self.width
+        force = self._force
+
+        with self.device as device:
+            for page in range(bitmap.pages):
+                if force:
+                    x0, x1 = 0, width
+                else:
+                    x0 = min(bitmap.dirty_x0[page], overlay.dirty_x0[page])
+                    x1 = max(bitmap.dirty_x1[page], overlay.dirty_x1[page])
+                    if x0 >= x1:
+                        continue  # Nothing drawn on this page
+
+                # Combine layers and find the columns the panel doesn't have yet
+                base = page * width
+                first, last = width, -1
+                for x in range(x0, x1):
+                    value = buffer[base + x] | over[base + x]
+                    data[x + 1] = value
+                    if force or value != sent[base + x]:
+                        sent[base + x] = value
+                        if x < first:
+                            first = x
+                        last = x
+                if last < 0:
+                    continue  # Redrawn but identical (e.g. erased and drawn again)
+
+                command[1] = _SET_COL_ADDR
+                command[2] = first
+                command[3] = last
+                command[4] = _SET_PAGE_ADDR
+                command[5] = page
+                command[6] = page
+                device.write(command)
+
+                # Control byte goes in the slot just before the first column
+                data[first] = _CONTROL_DATA
+                device.write(data, start=first, end=last + 2)
+                self.bytes_sent += last - first + 1
+
+        bitmap.clear_dirty()
+        overlay.clear_dirty()
+        self._force = False
+        return True
@@ -0,0 +1,59 @@
+# startup.py
+# Boot sequence: splash screen and cockpit HUD while the accelerometer
+# calibrates in the background, then on to the menu
+# Animations are imported only when they're actually shown
+
+import time
+
+# Startup modes (BOOT_MODE in config.py)
+BOOT_FULL = "full"    # Splash with chime, full HUD animation
+BOOT_SHORT = "short"  # Silent splash, 20 frame HUD
+BOOT_SKIP = "skip"    # No animations
+
+HUD_FRAMES_FULL = 60
+HUD_FRAMES_SHORT = 20
+
+def run_startup(display, buzzer, controls, tap_detector, mode=BOOT_FULL,
+                fast_calibration=False, hud_frames=None):
+    """
+    Play the startup animations and calibrate the accelerometer
+    One calibration reading is taken per animation frame (the same 50ms
+    spacing calibrate() uses), so the two overlap instead of adding up
+    Any button press skips the rest of the animations
+    hud_frames: pre-rendered HUD frame file (hud_frames.py), None = draw live
+    Returns when calibration is done
+    """
+    start = time.monotonic()
+    
+    # Saved baseline only needs a quick check, otherwise calibrate from scratch
+    if tap_detector.load_calibration():
+        tap_detector.start_validation(fast=fast_calibration)
+    else:
+        tap_detector.start_calibration(num_samples=30, fast=fast_calibration)
+    
+    if mode != BOOT_SKIP:
+        from animations import show_windows_splash, show_cockpit_hud_animation
+        from sounds import play_windows_sound, play_tone
+        
+        controls.clear()  # Only presses made during the animations count
+        
+        def background():
+            # Runs once per animation frame; True ends the animations
+            tap_detector.calibration_step()
+            return controls.poll() != 0
+        
+        skipped = show_windows_splash(display, buzzer, play_windows_sound,
+                                      idle=background, sound=(mode == BOOT_FULL))
+        if not skipped:
+            frames = HUD_FRAMES_FULL if mode == BOOT_FULL else HUD_FRAMES_SHORT
+            skipped = show_cockpit_hud_animation(display, buzzer, play_tone,
+                                                 idle=background,
+                                                 num_frames=frames,
+                                                 frames_path=hud_frames)
+        if skipped:
+            print("Startup animation skipped")
+            controls.clear()  # Don't let the skip press reach the menu
+    
+    # Whatever readings the animations didn't get to
+    tap_detector.finish_calibration()
+    print(f"Startup took {int((time.monotonic() - start) * 1000)} ms")
@@ -0,0 +1,115 @@
+# text_blit.py
+# Text drawn straight into a bitmap from a pre-rendered glyph atlas
+# Replaces Labels for short text that changes a lot (score, level, countdown)
+# Works on any bitmap, e.g. the HUD overlay in scene.py or a menu screen
+
+import displayio
+from blit import fill_rect, blit_region
+
+# Enough for the gameplay HUD: SC:, LVL:, TAP!, countdown, YOU WIN!
+HUD_CHARS = "0123456789 :!SCLVTAPYOUWIN"
+
+class GlyphAtlas:
+    """
+    The glyphs of a fixed-width font (e.g. terminalio.FONT) copied once
+    into one small bitmap, one cell per character
+    Characters that weren't included are drawn as blanks
+    """
+
+    def __init__(self, font, chars=HUD_CHARS):
+        """
+        font: fixed-width font (terminalio.FONT)
+        chars: every character that will be drawn
+        """
+        self.cell_width, self.cell_height = font.get_bounding_box()[:2]
+        self.bitmap = displayio.Bitmap(len(chars) * self.cell_width,
+                                       self.cell_height, 2)
+        self._cells = {}  # Character -> x of its cell in the atlas
+
+        for i, char in enumerate(chars):
+            glyph = font.get_glyph(ord(char))
+            if glyph is None:
+                continue
+            cell_x = i * self.cell_width
+            self._cells[char] = cell_x
+
+            # Glyph tiles are laid out in rows in the font's own bitmap
+            source = glyph.bitmap
+            per_row = source.width // glyph.width
+            gx = (glyph.tile_index % per_row) * glyph.width
+            gy = (glyph.tile_index // per_row) * glyph.height
+            blit_region(self.bitmap, source, cell_x, 0, gx, gy,
+                        gx + glyph.width, gy + glyph.height)
+
+    def cell(self, char):
+        """x of char's cell in the atlas, or -1 if it isn't in the atlas"""
+        return self._cells.get(char, -1)
+
+class TextSlot:
+    """
+    A spot in a bitmap that shows one string
+    Works like a Label for what the game uses (text, hidden), but draws
+    into the bitmap and only when the text actually changes
+    """
+
+    def __init__(self, atlas, bitmap, x, y, text=""):
+        """
+        atlas: GlyphAtlas with every character this slot will show
+        bitmap: where to draw (pixels outside the text are never touched)
+        x, y: left edge and vertical middle, same as a Label's x, y
+        """
+        self.atlas = atlas
+        self.bitmap = bitmap
+        self.x = x
+        self.top = y - atlas.cell_height // 2
+        self._text = text
+        self._hidden = False
+        self._drawn_width = 0  # Width in pixels currently drawn
+        self._draw()
+
+    @property
+    def text(self):
+        return self._text
+
+    @text.setter
+    def text(self, text):
+        if text == self._text:
+            return  # Same text: nothing to do
+        self._text = text
+        if not self._hidden:
+            self._draw()
+
+    @property
+    def hidden(self):
+        return self._hidden
+
+    @hidden.setter
+    def hidden(self, hidden):
+        if hidden == self._hidden:
+            return
+        self._hidden = hidden
+        if hidden:
+            self._erase()
+        else:
+            self._draw()
+
+    def _erase(self):
+        """Clear whatever this slot drew last"""
+        if self._drawn_width:
+            fill_rect(self.bitmap, self.x, self.top, self._drawn_width,
+                      self.atlas.cell_height, 0)
+            self._drawn_width = 0
+
+    def _draw(self):
+        """Erase the old text and copy in one atlas cell per character"""
+        self._erase()
+        atlas = self.atlas
+        width, height = atlas.cell_width, atlas.cell_height
+        x = self.x
+        for char in self._text:
+            cell_x = atlas.cell(char)
+            if cell_x >= 0:
+                blit_region(self.bitmap, atlas.bitmap, x, self.top,
+                            cell_x, 0, cell_x + width, height, False)
+            x += width
+        self._drawn_width = x - self.x